@@ -28,11 +28,12 @@ auth_router = APIRouter(prefix="/auth", tags=["auth"])
 def register_user(
     user: UserCreate, request: Request, session: Session = Depends(get_session)
 ):
+    # only existence matters here, skip loading the full user row
     existing_user = session.exec(
-        select(Users).where(Users.username == user.username)
+        select(Users.id).where(Users.username == user.username).limit(1)
     ).first()
 
-    if existing_user:
+    if existing_user is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered",
@@ -94,7 +94,7 @@ class ConnectionPool:
             self.ssl_context = ssl.create_default_context()
             self._initialized = True
             self.connection_stats = defaultdict(
-                lambda: {"created_at": 0, "reused": 0, "errors": 0}
+                lambda: {"created": 0, "reused": 0, "errors": 0}
             )
             logger.info(
                 "Initialized ConnectionPool",
@@ -134,7 +134,13 @@ class ConnectionPool:
             raise
 
     @asynccontextmanager
-    async def get_connection(self, host: str):
+    async def get_connection(self, host: str, fresh: bool = False):
+        """
+        Borrow a connection to host, returned to the pool afterwards
+
+        fresh skips the idle connections and opens a new one, for a retry
+        after a pooled connection turned out to be dead
+        """
         pool = self.pools[host]
         semaphore = self.host_semaphores[host]
         conn = None
@@ -154,7 +160,10 @@ class ConnectionPool:
         async with semaphore:
             start_time = time.time()
             try:
-                conn = await self.get_or_create_connection(pool, host)
+                if fresh:
+                    conn = await self._create_connection(host)
+                else:
+                    conn = await self.get_or_create_connection(pool, host)
                 conn.in_use = True
                 conn.last_used_at = time.time()
                 conn.use_count += 1
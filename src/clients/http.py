@@ -1,11 +1,17 @@
 import asyncio
+import functools
 import random
 import re
 import time
-from typing import Dict, Tuple, Any, Callable, Awaitable, TypeVar, Optional
-from io import BytesIO
+from collections import OrderedDict
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Tuple, Any, Callable, Awaitable, TypeVar, Optional, Mapping
 from urllib.parse import urlparse
 
+from curl_cffi.requests import AsyncSession
+
+from src.core.config import settings
 from src.core.logging import LogContext
 from src.models.http import HTTPHeaders
 from src.clients.connection import ConnectionPool
@@ -16,6 +22,35 @@ logger = LogContext(__name__)
 
 T = TypeVar("T")
 
+_MISSING = object()
+
+# Shared read-only config for hosts without special handling
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+# Requests safe to resend when the connection drops mid-exchange
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD"))
+_RETRYABLE_ERRORS = (asyncio.IncompleteReadError, ConnectionError, TimeoutError)
+
+# Response headers that no longer apply once curl has decoded the body
+_CURL_DECODED_HEADERS = frozenset(
+    ("content-encoding", "content-length", "transfer-encoding")
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_url(url: str) -> Tuple[str, str]:
+    """Split url into (host, path with query), feeds re-request the same urls"""
+    parsed_url = urlparse(url)
+    path = parsed_url.path if parsed_url.path else "/"
+    if parsed_url.query:
+        path += "?" + parsed_url.query
+    return parsed_url.netloc, path
+
+
+def _serialize_headers(headers: Mapping[str, str]) -> bytes:
+    """Serialize headers to "Name: value" lines"""
+    return "".join(f"{k}: {v}\r\n" for k, v in headers.items()).encode()
+
 
 class CaptchaError(Exception):
     """Raised when a CAPTCHA is detected"""
@@ -23,12 +58,12 @@ class CaptchaError(Exception):
     pass
 
 
-class CircuitState:
-    """Circuit states for breaker pattern"""
+class CircuitState(IntEnum):
+    """Circuit states for breaker pattern, values index the handler tables"""
 
-    CLOSED = "CLOSED"
-    OPEN = "OPEN"
-    HALF_OPEN = "HALF_OPEN"
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
 
 
 class CircuitBreaker:
@@ -39,38 +74,84 @@ class CircuitBreaker:
         reset_timeout: float = 15 * 60,
         backoff_multiplier: float = 2.0,
         max_timeout: float = 4 * 60 * 60,
+        cache_ttl: float = 60.0,
+        cache_maxsize: int = 256,
+        jitter: bool = True,
     ):
         self.name = name
         self.failure_threshold = failure_threshold
         self.reset_timeout = reset_timeout
         self.backoff_multiplier = backoff_multiplier
         self.max_timeout = max_timeout
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self.jitter = jitter
 
-        # state tracking
+        # state tracking, last_failure_time and open_until are monotonic
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.last_failure_time = 0
         self.current_timeout = reset_timeout
+        self.open_until = 0.0
+
+        # LRU cache for fallback data, entries are (value, expires_at)
+        self.cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+
+        # in-flight requests per cache key, used to coalesce concurrent calls
+        self._inflight: Dict[str, asyncio.Future] = {}
 
-        # cache for fallback data
-        self.cache = {}
+        # state transition handlers indexed by CircuitState
+        self._on_success = (self._closed_success, self._noop, self._half_open_success)
+        self._on_failure = (self._closed_failure, self._noop, self._half_open_failure)
+
+    def _get_cached(self, cache_key: str) -> Any:
+        """Return cached value or _MISSING, evicting it lazily if expired"""
+        entry = self.cache.get(cache_key)
+        if entry is None:
+            return _MISSING
+
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self.cache[cache_key]
+            return _MISSING
+
+        self.cache.move_to_end(cache_key)
+        return value
+
+    def _set_cached(self, cache_key: str, value: Any) -> None:
+        """Store value with a fresh expiry, evicting least recently used entries"""
+        self.cache[cache_key] = (value, time.monotonic() + self.cache_ttl)
+        self.cache.move_to_end(cache_key)
+        while len(self.cache) > self.cache_maxsize:
+            self.cache.popitem(last=False)
 
     async def execute(
         self,
         func: Callable[..., Awaitable[T]],
-        cache_key: str | None = None,
         *args,
+        cache_key: str | None = None,
+        fallback: Callable[[], Awaitable[T]] | None = None,
         **kwargs,
     ) -> T:
-        """Execute function with circuit breaker pattern"""
+        """
+        Execute function with circuit breaker pattern
+
+        cache_key and fallback are keyword-only so positional arguments always
+        reach func. The fallback is awaited without arguments whenever the call
+        can't be served: circuit open with nothing cached, or the call failed.
+        """
         if self.state == CircuitState.OPEN:
-            if time.time() - self.last_failure_time < self.current_timeout:
-                if cache_key in self.cache:
-                    logger.info(
-                        "Circuit OPEN - using cached data",
-                        extra={"circuit_name": self.name, "cache_key": cache_key},
-                    )
-                    return self.cache[cache_key]
+            if time.monotonic() < self.open_until:
+                if cache_key is not None:
+                    cached = self._get_cached(cache_key)
+                    if cached is not _MISSING:
+                        logger.info(
+                            "Circuit OPEN - using cached data",
+                            extra={"circuit_name": self.name, "cache_key": cache_key},
+                        )
+                        return cached
+                if fallback is not None:
+                    return await fallback()
                 raise HTTPClientError(detail=f"Circuit {self.name} is OPEN")
 
             logger.info(
@@ -79,58 +160,115 @@ class CircuitBreaker:
             )
             self.state = CircuitState.HALF_OPEN
 
+        # Coalesce concurrent calls for the same key onto one upstream request
+        future = None
+        if cache_key is not None:
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None:
+                try:
+                    return await asyncio.shield(inflight)
+                except Exception:
+                    if fallback is None:
+                        raise
+                    return await fallback()
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = future
+
         try:
             result = await func(*args, **kwargs)
+            self._on_success[self.state]()
 
-            if self.state == CircuitState.HALF_OPEN:
-                logger.info(
-                    "Circuit recovery successful - CLOSED",
-                    extra={"circuit_name": self.name},
-                )
-
-            if cache_key is not None:
-                self.cache[cache_key] = result
+            if future is not None:
+                self._set_cached(cache_key, result)
+                future.set_result(result)
 
             return result
         except Exception as e:
+            if future is not None:
+                future.set_exception(e)
+                # mark as retrieved so an unawaited future doesn't log a warning
+                future.exception()
+
             self.failure_count += 1
-            self.last_failure_time = time.time()
-
-            if (
-                self.state == CircuitState.CLOSED
-                and self.failure_count >= self.failure_threshold
-            ):
-                self.state = CircuitState.OPEN
-                logger.warning(
-                    "Circuit OPEN - threshold reached",
-                    extra={
-                        "error": str(e),
-                        "circuit_name": self.name,
-                        "state": self.state,
-                        "failure_count": self.failure_count,
-                        "last_failure_time": self.last_failure_time,
-                        "error_type": e.__class__.__name__,
-                    },
-                )
+            self.last_failure_time = time.monotonic()
+            self._on_failure[self.state](e)
+
+            if fallback is None:
+                raise
+        finally:
+            if future is not None:
+                if not future.done():
+                    # The leader was cancelled, that says nothing about the
+                    # followers, fail them so they take their own fallback
+                    future.set_exception(
+                        HTTPClientError(
+                            detail=f"Coalesced call on {self.name} was cancelled"
+                        )
+                    )
+                    future.exception()
+                self._inflight.pop(cache_key, None)
 
-            elif self.state == CircuitState.HALF_OPEN:
-                self.state = CircuitState.OPEN
-                self.current_timeout = min(
-                    self.current_timeout * self.backoff_multiplier, self.max_timeout
-                )
-                logger.warning(
-                    "Circuit OPEN - test failed",
-                    extra={
-                        "error": str(e),
-                        "circuit_name": self.name,
-                        "state": self.state,
-                        "failure_count": self.failure_count,
-                        "last_failure_time": self.last_failure_time,
-                        "error_type": e.__class__.__name__,
-                    },
-                )
+        return await fallback()
+
+    def _noop(self, *args) -> None:
+        """no transition for this state"""
+
+    def _closed_success(self) -> None:
+        self.failure_count = 0
 
-            raise
+    def _half_open_success(self) -> None:
+        self._reset()
+        logger.info(
+            "Circuit recovery successful - CLOSED",
+            extra={"circuit_name": self.name},
+        )
+
+    def _closed_failure(self, e: Exception) -> None:
+        if self.failure_count < self.failure_threshold:
+            return
+
+        self._open()
+        logger.warning(
+            "Circuit OPEN - threshold reached",
+            extra={
+                "error": str(e),
+                "circuit_name": self.name,
+                "state": self.state.name,
+                "failure_count": self.failure_count,
+                "last_failure_time": self.last_failure_time,
+                "error_type": e.__class__.__name__,
+            },
+        )
+
+    def _half_open_failure(self, e: Exception) -> None:
+        self.current_timeout = min(
+            self.current_timeout * self.backoff_multiplier, self.max_timeout
+        )
+        self._open()
+        logger.warning(
+            "Circuit OPEN - test failed",
+            extra={
+                "error": str(e),
+                "circuit_name": self.name,
+                "state": self.state.name,
+                "failure_count": self.failure_count,
+                "last_failure_time": self.last_failure_time,
+                "error_type": e.__class__.__name__,
+            },
+        )
+
+    def _open(self) -> None:
+        """
+        Open the circuit for the current timeout
+
+        With jitter the window is drawn from [timeout / 2, timeout] so breakers
+        in different workers that tripped together don't probe in lockstep
+        """
+        self.state = CircuitState.OPEN
+        timeout = self.current_timeout
+        if self.jitter:
+            timeout = random.uniform(timeout / 2, timeout)
+        self.open_until = self.last_failure_time + timeout
 
     def _reset(self):
         """reset circuit to closed state"""
@@ -140,26 +278,58 @@ class CircuitBreaker:
 
     def get_state(self):
         """get current circuit state info"""
+        last_failure_time = 0
+        if self.last_failure_time:
+            # report as wall clock time for humans
+            last_failure_time = time.time() - (
+                time.monotonic() - self.last_failure_time
+            )
+
         return {
             "name": self.name,
-            "state": self.state,
+            "state": self.state.name,
             "failure_count": self.failure_count,
-            "last_failure_time": self.last_failure_time,
+            "last_failure_time": last_failure_time,
             "current_timeout": self.current_timeout,
         }
 
 
 class HTTPClient:
-    def __init__(self, connection_pool: ConnectionPool, health_service=None) -> None:
+    def __init__(
+        self,
+        connection_pool: ConnectionPool,
+        health_service=None,
+        max_tracked_hosts: int = settings.HTTP_MAX_TRACKED_HOSTS,
+    ) -> None:
         self.connection_pool = connection_pool
         self.health_service = health_service
-        self._cookies: Dict[str, Dict[str, str]] = {}
-        self._user_agents = [
+
+        # Per-host state, LRU ordered and capped at max_tracked_hosts
+        self.max_tracked_hosts = max_tracked_hosts
+        self._cookies: OrderedDict[str, Dict[str, str]] = OrderedDict()
+        # Serialized Cookie header per jar, rebuilt only when the jar changes
+        self._cookie_headers: OrderedDict[str, bytes] = OrderedDict()
+        self._circuit_breakers: OrderedDict[str, CircuitBreaker] = OrderedDict()
+        self._host_semaphores: OrderedDict[str, asyncio.Semaphore] = OrderedDict()
+
+        self._user_agents = (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.3 Safari/605.1.15",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
-        ]
-        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        )
+        self._user_agent_headers = tuple(
+            f"User-Agent: {user_agent}\r\n".encode() for user_agent in self._user_agents
+        )
+        self._default_user_agent_header = (
+            f"User-Agent: {DEFAULT_USER_AGENT}\r\n".encode()
+        )
+        self._ua_choice = random.Random().choice
+
+        # Persistent impersonating session for curl domains, keeps TCP+TLS warm.
+        # It reuses a pool of curl handles sized like the connection pool.
+        self._curl_session = AsyncSession(
+            impersonate="chrome110", max_clients=settings.POOL_SIZE
+        )
 
         # Special domains configuration
         self._special_domains = {
@@ -175,6 +345,7 @@ class HTTPClient:
                     "Accept: */*",
                 ],
                 "captcha_detection": ["Are you a robot", "unusual activity"],
+                "max_concurrency": 8,
                 "circuit_breaker": {
                     "failure_threshold": 2,
                     "reset_timeout": 15 * 60,  # 15 minutes
@@ -194,6 +365,7 @@ class HTTPClient:
                     "Accept: */*",
                 ],
                 "captcha_detection": ["bot", "automated", "captcha"],
+                "max_concurrency": 8,
                 "circuit_breaker": {
                     "failure_threshold": 2,
                     "reset_timeout": 15 * 60,  # 15 minutes
@@ -203,40 +375,120 @@ class HTTPClient:
             },
         }
 
+        # One compiled alternation per domain replaces the per-endpoint substring
+        # scans, and decisions are cached per URL since feeds are re-polled
+        for config in self._special_domains.values():
+            endpoints = config.get("curl_endpoints")
+            if endpoints:
+                config["_curl_matcher"] = re.compile(
+                    "|".join(map(re.escape, endpoints))
+                )
+            # Captcha phrases are matched on the raw body bytes, no decode
+            phrases = config.get("captcha_detection")
+            if phrases:
+                config["_captcha_matcher"] = re.compile(
+                    b"|".join(re.escape(phrase.encode()) for phrase in phrases)
+                )
+        self._should_use_curl = functools.lru_cache(maxsize=4096)(self._should_use_curl)
+
+        # One alternation over every special domain, anchored on a label
+        # boundary, with the matched group naming the domain
+        self._special_domains_by_group = {
+            f"d{i}": config for i, config in enumerate(self._special_domains.values())
+        }
+        self._subdomain_pattern = re.compile(
+            r"\.(?:"
+            + "|".join(
+                f"(?P<d{i}>{re.escape(domain)})"
+                for i, domain in enumerate(self._special_domains)
+            )
+            + r")\Z"
+        )
+        # Host -> config is fixed after init, resolve each host once
+        self._get_domain_config = functools.lru_cache(maxsize=max_tracked_hosts)(
+            self._get_domain_config
+        )
+
+        # Pre-serialized static request headers per host and caller headers
+        # (all but User-Agent), capped like the other per-host state
+        self._header_templates: OrderedDict[Any, bytes] = OrderedDict()
+        for domain in self._special_domains:
+            self._get_header_template(domain)
+
     async def _read_chunked_body(self, reader: asyncio.StreamReader) -> bytes:
-        buffer = BytesIO()
+        # Views into each chunk are joined once at the end, so chunk bytes are
+        # copied exactly one time instead of into a growing buffer and out again
+        chunks = []
         while True:
             chunk_size_line = await reader.readuntil(b"\r\n")
-            chunk_size = int(chunk_size_line.strip(), 16)
+            # Line is "<hex>[;ext]\r\n", drop extensions and the CRLF
+            end = chunk_size_line.find(b";")
+            if end < 0:
+                end = len(chunk_size_line) - 2
+            chunk_size = int(chunk_size_line[:end], 16)
 
             if chunk_size == 0:
-                await reader.readexactly(2)
+                # Skip any trailer fields up to the terminating empty line
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
                 break
 
-            chunk = await reader.readexactly(chunk_size)
-            buffer.write(chunk)
-            await reader.readexactly(2)
+            # Read the chunk and its trailing CRLF in one go
+            chunk = await reader.readexactly(chunk_size + 2)
+            chunks.append(memoryview(chunk)[:chunk_size])
 
-        return buffer.getvalue()
+        return b"".join(chunks)
 
     async def _read_body(
         self, reader: asyncio.StreamReader, content_length: int
     ) -> bytes:
-        buffer = BytesIO()
-        while len(buffer.getvalue()) < content_length:
-            body = await reader.read(4096)
-            buffer.write(body)
-        return buffer.getvalue()
-
-    def _get_domain_config(self, host: str) -> Dict[str, Any]:
-        if host in self._special_domains:
-            return self._special_domains[host]
-
-        for domain, config in self._special_domains.items():
-            pattern = domain.replace(".", r"\.")
-            if re.match(f".*{pattern}.*", host):
-                return config
-        return {}
+        # StreamReader buffers internally, one readexactly avoids re-joining
+        # 4KB reads and raises IncompleteReadError if the server hangs up early
+        return await reader.readexactly(content_length)
+
+    async def _read_response(
+        self, reader: asyncio.StreamReader, method: str
+    ) -> Tuple[HTTPHeaders, bytes, bool]:
+        """
+        Read status line, headers and body framed per RFC 9112 section 6.3
+
+        Returns the headers, the body and whether the connection can be reused
+        """
+        header_data = await reader.readuntil(b"\r\n\r\n")
+        response_headers = HTTPHeaders.from_bytes(header_data)
+
+        connection = (response_headers.get("connection") or "").lower()
+        keep_alive = "close" not in connection
+        if response_headers.status_line.startswith("HTTP/1.0"):
+            keep_alive = "keep-alive" in connection
+
+        status_code = response_headers.status_code
+        if method == "HEAD" or status_code in (204, 304) or status_code < 200:
+            return response_headers, b"", keep_alive
+
+        transfer_encoding = response_headers.get("transfer-encoding")
+        if transfer_encoding and "chunked" in transfer_encoding.lower():
+            body = await self._read_chunked_body(reader)
+            return response_headers, body, keep_alive
+
+        content_length = response_headers.get("content-length")
+        if content_length is not None:
+            body = await self._read_body(reader, int(content_length))
+            return response_headers, body, keep_alive
+
+        # No framing, the body runs until the server closes the connection
+        return response_headers, await reader.read(), False
+
+    def _get_domain_config(self, host: str) -> Mapping[str, Any]:
+        config = self._special_domains.get(host)
+        if config is not None:
+            return config
+
+        # Subdomains share the parent domain's config
+        match = self._subdomain_pattern.search(host)
+        if match is None:
+            return _EMPTY_CONFIG
+        return self._special_domains_by_group[match.lastgroup]
 
     def _prepare_headers(self, host: str, headers: Dict[str, str]) -> Dict[str, str]:
         """prepare request headers with domain specific customizations"""
@@ -244,7 +496,7 @@ class HTTPClient:
         config = self._get_domain_config(host)
 
         if config.get("rotate_user_agent", False):
-            result_headers["User-Agent"] = random.choice(self._user_agents)
+            result_headers["User-Agent"] = self._ua_choice(self._user_agents)
         else:
             result_headers["User-Agent"] = DEFAULT_USER_AGENT
 
@@ -269,50 +521,85 @@ class HTTPClient:
 
         return result_headers
 
+    def _get_header_template(
+        self, host: str, extra_headers: Optional[Dict[str, str]] = None
+    ) -> bytes:
+        """get serialized static headers for host, built once on first use"""
+        key = (host, frozenset(extra_headers.items())) if extra_headers else host
+        template = self._header_templates.get(key)
+        if template is None:
+            headers = self._prepare_headers(host, extra_headers or {})
+            del headers["User-Agent"]
+            template = _serialize_headers(headers)
+            self._track_host(self._header_templates, key, template)
+        return template
+
+    def _user_agent_header(self, host: str) -> bytes:
+        """get serialized User-Agent header, rotated for configured domains"""
+        if self._get_domain_config(host).get("rotate_user_agent", False):
+            return self._ua_choice(self._user_agent_headers)
+        return self._default_user_agent_header
+
     def _extract_cookies(self, host: str, response_headers: HTTPHeaders) -> None:
         """extract cookies from response headers"""
         config = self._get_domain_config(host)
         if not config.get("preserve_cookies", False):
             return
 
-        if host not in self._cookies:
-            self._cookies[host] = {}
+        set_cookies = response_headers.set_cookies
+        if not set_cookies:
+            return
+
+        cookies = self._cookies.get(host)
+        if cookies is None:
+            cookies = {}
+
+        # Single pass per cookie: "name=value; attr; attr=..."
+        for cookie in set_cookies:
+            eq = cookie.find("=")
+            if eq <= 0:
+                continue
+            end = cookie.find(";", eq)
+            if end < 0:
+                end = len(cookie)
+            cookies[cookie[:eq].strip()] = cookie[eq + 1 : end].strip()
+
+        # Jar and header are touched together so they age out together
+        self._track_host(self._cookies, host, cookies)
+        if cookies:
+            cookie_header = "; ".join(f"{k}={v}" for k, v in cookies.items())
+            self._track_host(
+                self._cookie_headers, host, f"Cookie: {cookie_header}\r\n".encode()
+            )
 
-        set_cookie = response_headers.headers.get("Set-Cookie")
-        if set_cookie:
-            cookies = [set_cookie]
-            for cookie in cookies:
-                if "=" in cookie:
-                    name, value = cookie.split("=", 1)
-                    if ";" in value:
-                        value = value.split(";")[0]
-                    self._cookies[host][name.strip()] = value.strip()
+    def _track_host(self, per_host: OrderedDict, host: str, value: Any) -> None:
+        """insert per-host state, evicting the least recently used host if full"""
+        per_host[host] = value
+        per_host.move_to_end(host)
+        while len(per_host) > self.max_tracked_hosts:
+            per_host.popitem(last=False)
 
     def _check_for_captcha(self, host: str, body: bytes) -> bool:
         """check if response has captcha challenge"""
-        config = self._get_domain_config(host)
-        captcha_phrases = config.get("captcha_detection", [])
-
-        if not captcha_phrases:
+        matcher = self._get_domain_config(host).get("_captcha_matcher")
+        if matcher is None:
             return False
 
-        try:
-            body_text = body.decode("utf-8", errors="replace")
-            for phrase in captcha_phrases:
-                if phrase in body_text:
-                    logger.warning(
-                        "CAPTCHA detected", extra={"host": host, "phrase": phrase}
-                    )
-                    return True
-        except:
-            pass
+        match = matcher.search(body)
+        if match is None:
+            return False
 
-        return False
+        logger.warning(
+            "CAPTCHA detected", extra={"host": host, "phrase": match.group().decode()}
+        )
+        return True
 
     def _get_circuit_breaker(self, host: str) -> Optional[CircuitBreaker]:
         """get or create domain-specific circuit breaker"""
-        if host in self._circuit_breakers:
-            return self._circuit_breakers[host]
+        breaker = self._circuit_breakers.get(host)
+        if breaker is not None:
+            self._circuit_breakers.move_to_end(host)
+            return breaker
 
         config = self._get_domain_config(host)
         cb_config = config.get("circuit_breaker")
@@ -327,9 +614,24 @@ class HTTPClient:
         else:
             breaker = CircuitBreaker(name=host, **cb_config)
 
-        self._circuit_breakers[host] = breaker
+        self._track_host(self._circuit_breakers, host, breaker)
         return breaker
 
+    def _get_host_semaphore(self, host: str) -> Optional[asyncio.Semaphore]:
+        """get or create the concurrency bulkhead for domains that set one"""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is not None:
+            self._host_semaphores.move_to_end(host)
+            return semaphore
+
+        limit = self._get_domain_config(host).get("max_concurrency")
+        if not limit:
+            return None
+
+        semaphore = asyncio.Semaphore(limit)
+        self._track_host(self._host_semaphores, host, semaphore)
+        return semaphore
+
     def _should_use_curl(self, host: str, url: str) -> bool:
         """Determine if curl should be used for this domain and endpoint"""
         config = self._get_domain_config(host)
@@ -337,202 +639,294 @@ class HTTPClient:
         if not config.get("use_curl", False):
             return False
 
-        curl_endpoints = config.get("curl_endpoints", [])
-        if not curl_endpoints:
+        matcher = config.get("_curl_matcher")
+        if matcher is None:
             return True  # Use curl for all endpoints if no specific ones listed
 
         # Check if any of the endpoints are in the URL
-        return any(endpoint in url for endpoint in curl_endpoints)
+        return matcher.search(url) is not None
 
-    async def _fetch_with_curl(self, url: str, host: str) -> Tuple[HTTPHeaders, bytes]:
-        """Fetch content using curl with domain-specific configurations"""
+    async def _fetch_with_curl(
+        self,
+        url: str,
+        host: str,
+        conditional_headers: Mapping[str, str] | None = None,
+    ) -> Tuple[HTTPHeaders, bytes]:
+        """Fetch content using curl_cffi with domain-specific configurations"""
         config = self._get_domain_config(host)
 
-        # Base curl command
-        cmd = ["curl", "-s", url]
-
-        # Add headers from config
+        # Convert "Name: value" header lines from config
         curl_headers = config.get("curl_headers", [])
-        for header in curl_headers:
-            cmd.extend(["-H", header])
+        headers = dict(header.split(": ", 1) for header in curl_headers)
+        if conditional_headers:
+            headers.update(conditional_headers)
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            response = await self._curl_session.get(url, headers=headers)
+
+            # curl has already decoded and de-chunked the body, so the framing
+            # headers no longer describe response.content
+            response_headers = HTTPHeaders.from_items(
+                f"HTTP/1.1 {response.status_code} {response.reason}",
+                (
+                    item
+                    for item in response.headers.multi_items()
+                    if item[0].lower() not in _CURL_DECODED_HEADERS
+                ),
             )
-            stdout, stderr = await process.communicate()
-
-            if stderr:
-                logger.warning(
-                    "Curl reported errors",
-                    extra={
-                        "stderr": stderr.decode("utf-8", errors="replace"),
-                        "host": host,
-                        "url": url,
-                    },
-                )
-
-            # Create default headers
-            response_headers = HTTPHeaders.from_bytes(
-                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
-            )
-            return response_headers, stdout
+            return response_headers, response.content
         except Exception as e:
             logger.error(
                 "Error executing curl",
                 extra={
                     "error": str(e),
                     "error_type": e.__class__.__name__,
-                    "command": " ".join(cmd),
                     "host": host,
                     "url": url,
                 },
             )
             raise HTTPClientError(detail=f"Error fetching with curl: {str(e)}")
 
-    async def request(
-        self, method: str, url: str, request_headers: Dict[str, str] | None = None
+    async def _send(
+        self, method: str, host: str, request: bytes
     ) -> Tuple[HTTPHeaders, bytes]:
-        parsed_url = urlparse(url)
-        host = parsed_url.netloc
-        path = parsed_url.path if parsed_url.path else "/"
-        if parsed_url.query:
-            path += "?" + parsed_url.query
-
-        circuit_breaker = self._get_circuit_breaker(host)
+        """
+        Write request on a pooled connection and read the response
+
+        Idempotent requests get one retry on a newly opened connection when
+        the connection drops, most often a keep-alive socket the server already
+        closed, so a single blip doesn't count towards the circuit breaker.
+        The retry skips the pool, its other idle sockets may be just as stale
+        """
+        attempts = 2 if method in _IDEMPOTENT_METHODS else 1
+        for attempt in range(1, attempts + 1):
+            try:
+                async with self.connection_pool.get_connection(
+                    host, fresh=attempt > 1
+                ) as conn:
+                    try:
+                        conn.writer.write(request)
+                        # Small requests are usually sent in full by write(), only
+                        # wait for the buffer to flush when the kernel didn't take
+                        # it all
+                        if conn.writer.transport.get_write_buffer_size():
+                            await conn.writer.drain()
+                        response_headers, body, keep_alive = await self._read_response(
+                            conn.reader, method
+                        )
+                    except BaseException:
+                        # A half-read response would poison the next request on
+                        # this connection, closing it keeps it out of the pool
+                        conn.writer.close()
+                        raise
 
-        # Check if we should use curl for this domain/endpoint
-        if self._should_use_curl(host, url):
-            return await self._fetch_with_curl(url, host)
+                    if not keep_alive:
+                        conn.writer.close()
 
-        async def make_request():
-            headers = self._prepare_headers(host, request_headers or {})
+                    return response_headers, body
+            except _RETRYABLE_ERRORS as e:
+                if attempt == attempts:
+                    raise
+                logger.info(
+                    "Retrying request on a fresh connection",
+                    extra={
+                        "host": host,
+                        "error": str(e),
+                        "error_type": e.__class__.__name__,
+                    },
+                )
+                await asyncio.sleep(random.uniform(0.05, 0.2))
 
-            request = (
-                f"{method} {path} HTTP/1.1\r\n"
-                f"{chr(10).join(f'{k}: {v}' for k, v in headers.items())}\r\n\r\n"
+    async def _do_request(
+        self,
+        method: str,
+        path: str,
+        host: str,
+        url: str,
+        request_headers: Dict[str, str] | None,
+        conditional_headers: Mapping[str, str] | None = None,
+    ) -> Tuple[HTTPHeaders, bytes]:
+        """send request over a pooled connection and read the response"""
+        # Only the request line is encoded per call, the header pieces are
+        # cached bytes and one join copies everything into the final buffer
+        request = b"".join(
+            (
+                f"{method} {path} HTTP/1.1\r\n".encode(),
+                self._user_agent_header(host),
+                self._cookie_headers.get(host, b""),
+                self._get_header_template(host, request_headers),
+                _serialize_headers(conditional_headers) if conditional_headers else b"",
+                b"\r\n",
             )
+        )
 
-            try:
-                async with self.connection_pool.get_connection(host) as conn:
-                    conn.writer.write(request.encode())
-                    await conn.writer.drain()
-                    header_data = await conn.reader.readuntil(b"\r\n\r\n")
-                    response_headers = HTTPHeaders.from_bytes(header_data)
-
-                    self._extract_cookies(host, response_headers)
+        try:
+            response_headers, body = await self._send(method, host, request)
+            self._extract_cookies(host, response_headers)
 
-                    transfer_encoding = response_headers.headers.get(
-                        "Transfer-Encoding", None
+            now = time.time()
+            if self._check_for_captcha(host, body):
+                if self.health_service:
+                    self.health_service.update_service_health(
+                        f"http_{host}",
+                        state="degraded",
+                        failure_count=1,
+                        last_failure_time=now,
+                        last_error=f"CAPTCHA challenge detected on {host}",
                     )
-                    if not transfer_encoding:
-                        transfer_encoding = response_headers.headers.get(
-                            "transfer-encoding", None
-                        )
-                    if transfer_encoding:
-                        body = await self._read_chunked_body(conn.reader)
-                    else:
-                        content_length = response_headers.headers.get(
-                            "Content-Length", "0"
-                        )
-                        content_length = int(content_length)
-                        body = await self._read_body(conn.reader, content_length)
-
-                    if self._check_for_captcha(host, body):
-                        if self.health_service:
-                            self.health_service.update_service_health(
-                                f"http_{host}",
-                                state="degraded",
-                                failure_count=1,
-                                last_failure_time=time.time(),
-                                last_error=f"CAPTCHA challenge detected on {host}",
-                            )
-                        raise CaptchaError(f"CAPTCHA challenge detected on {host}")
-
-                    if self.health_service:
-                        self.health_service.update_service_health(
-                            f"https_{host}",
-                            state="operational",
-                            last_success_time=time.time(),
-                        )
+                raise CaptchaError(f"CAPTCHA challenge detected on {host}")
 
-                    return response_headers, body
+            if self.health_service:
+                self.health_service.update_service_health(
+                    f"https_{host}",
+                    state="operational",
+                    last_success_time=now,
+                )
+
+            return response_headers, body
+
+        except Exception as e:
+            logger.error(
+                "HTTP Request error",
+                extra={
+                    "error": str(e),
+                    "url": url,
+                    "error_type": e.__class__.__name__,
+                },
+            )
+
+            if self.health_service:
+                self.health_service.update_service_health(
+                    f"https_{host}",
+                    state="degraded",
+                    failure_count=1,
+                    last_failure_time=time.time(),
+                    last_error=str(e),
+                )
+
+            raise HTTPClientError(
+                detail=f"Failed to make HTTP request: {str(e)}", host=host
+            )
 
+    async def _do_fallback(self, host: str, url: str) -> Tuple[HTTPHeaders, bytes]:
+        """fall back to curl for special domains, otherwise report unavailable"""
+        logger.info("Using fallback for HTTP request", extra={"host": host})
+
+        # Try curl fallback for any special domain
+        config = self._get_domain_config(host)
+        if config:
+            try:
+                return await self._fetch_with_curl(url, host)
             except Exception as e:
                 logger.error(
-                    "HTTP Request error",
+                    "Fallback to curl also failed",
                     extra={
                         "error": str(e),
+                        "host": host,
                         "url": url,
                         "error_type": e.__class__.__name__,
                     },
                 )
 
-                if self.health_service:
-                    self.health_service.update_service_health(
-                        f"https_{host}",
-                        state="degraded",
-                        failure_count=1,
-                        last_failure_time=time.time(),
-                        last_error=str(e),
-                    )
+        raise ServiceUnavailableError(
+            service=f"https_{host}",
+            detail=f"Service {host} is temporarily unavailable",
+            retry_after=60,
+        )
 
-                raise HTTPClientError(
-                    detail=f"Failed to make HTTP request: {str(e)}", host=host
-                )
+    async def request(
+        self,
+        method: str,
+        url: str,
+        request_headers: Dict[str, str] | None = None,
+        conditional_headers: Mapping[str, str] | None = None,
+    ) -> Tuple[HTTPHeaders, bytes]:
+        """
+        Send a request, routed through curl, the circuit breaker or a plain request
+
+        request_headers are serialized once per host and cached, so they should be
+        static. Per-request values such as If-None-Match go in conditional_headers.
+        """
+        host, path = _parse_url(url)
+
+        # Bulkhead for slow or rate limited domains. The curl path shares one
+        # handle pool across hosts and isn't covered by the connection pool's
+        # per-host limit, so without this one domain can take every handle
+        semaphore = self._get_host_semaphore(host)
+        if semaphore is None:
+            return await self._dispatch(
+                method, url, host, path, request_headers, conditional_headers
+            )
+        async with semaphore:
+            return await self._dispatch(
+                method, url, host, path, request_headers, conditional_headers
+            )
+
+    async def _dispatch(
+        self,
+        method: str,
+        url: str,
+        host: str,
+        path: str,
+        request_headers: Dict[str, str] | None,
+        conditional_headers: Mapping[str, str] | None = None,
+    ) -> Tuple[HTTPHeaders, bytes]:
+        """route a request to curl, the circuit breaker or a plain request"""
+        circuit_breaker = self._get_circuit_breaker(host)
 
-        async def request_fallback():
-            logger.info("Using fallback for HTTP request", extra={"host": host})
+        # Check if we should use curl for this domain/endpoint
+        if self._should_use_curl(host, url):
+            return await self._fetch_with_curl(url, host, conditional_headers)
 
-            # Try curl fallback for any special domain
-            config = self._get_domain_config(host)
-            if config:
-                try:
-                    return await self._fetch_with_curl(url, host)
-                except Exception as e:
-                    logger.error(
-                        "Fallback to curl also failed",
-                        extra={
-                            "error": str(e),
-                            "host": host,
-                            "url": url,
-                            "error_type": e.__class__.__name__,
-                        },
+        if circuit_breaker:
+            # Only identical requests share a response. A HEAD has no body for
+            # a GET and a 304 for one caller's validators is no answer to a
+            # plain GET, so the method and every header are part of the key
+            cache_key = f"{method}_{host}_{path}"
+            for headers in (request_headers, conditional_headers):
+                if headers:
+                    cache_key += "".join(
+                        f"_{name}={value}" for name, value in sorted(headers.items())
                     )
 
-            raise ServiceUnavailableError(
-                service=f"https_{host}",
-                detail=f"Service {host} is temporarily unavailable",
-                retry_after=60,
+            # Arguments are bound up front, the HealthService breaker forwards
+            # execute()'s args to the fallback as well as to func
+            return await circuit_breaker.execute(
+                functools.partial(
+                    self._do_request,
+                    method,
+                    path,
+                    host,
+                    url,
+                    request_headers,
+                    conditional_headers,
+                ),
+                cache_key=cache_key,
+                fallback=functools.partial(self._do_fallback, host, url),
             )
 
-        if circuit_breaker:
-            cache_key = f"{host}_{path}"
-            try:
-                return await circuit_breaker.execute(
-                    make_request,
-                    cache_key=cache_key,
-                )
-            except CaptchaError as e:
-                # If we get a captcha, try the fallback
-                logger.warning(
-                    "CAPTCHA detected, trying fallback",
-                    extra={"host": host, "url": url},
-                )
-                try:
-                    return await request_fallback()
-                except Exception:
-                    raise HTTPClientError(detail=str(e), host=host)
-            except Exception:
-                # For other errors, try the fallback
-                return await request_fallback()
-        else:
-            try:
-                return await make_request()
-            except Exception:
-                return await request_fallback()
+        try:
+            return await self._do_request(
+                method, path, host, url, request_headers, conditional_headers
+            )
+        except Exception:
+            return await self._do_fallback(host, url)
+
+    async def close(self) -> None:
+        """Close the persistent curl session"""
+        try:
+            await self._curl_session.close()
+        except Exception as e:
+            logger.warning(
+                "Error closing curl session",
+                extra={"error": str(e), "error_type": e.__class__.__name__},
+            )
+
+    async def __aenter__(self) -> "HTTPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
     def get_circuit_breaker_status(self) -> Dict[str, Any]:
         """get status of all circuit breakers"""
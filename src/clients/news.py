@@ -1,24 +1,187 @@
-import gzip
 import time
+import contextlib
 import asyncio
-from typing import List, Tuple, Any, Set, Dict, Optional
-from sqlmodel import Session, select
+import logging
+from datetime import datetime, timezone
+from collections import OrderedDict, defaultdict
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from redis.exceptions import RedisError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, bindparam, insert, select, tuple_, update
 from src.clients.redis import RedisClient
-from src.core.logging import LogContext, PerformanceLogger, add_correlation_id
-from src.models.db_models import Articles, Feeds
+from src.core.logging import (
+    LogContext,
+    LogThrottle,
+    PerformanceLogger,
+    add_correlation_id,
+)
+from src.models.db_models import ArticleFeeds, Articles, Feeds
 from src.clients.http import HTTPClient
 from src.clients.connection import ConnectionPool
-from src.core.exceptions import RSSFeedError
+from src.core.exceptions import RSSFeedError, ServiceUnavailableError
 from src.parsers.xml import XMLFeedParser
 from src.parsers.json import JSONFeedParser
 from src.parsers.base import FeedParser
 from src.core.config import settings
+from src.constants import RSS_FEEDS
 from src.core.degradation import HealthService
-from src.utils.text_utils import calculate_title_similarity
+from src.utils.batching import KeyBatcher
+from src.utils.latency import LatencyWindow
+from src.utils.text_utils import matcher_similarity, title_matcher
+
+try:
+    # ISA-L's SIMD inflate is ~2-3x faster than the stdlib zlib build
+    from isal.igzip import decompress as gunzip
+    from isal import isal_zlib as zlib
+except ImportError:
+    from gzip import decompress as gunzip
+    import zlib
 
 
 logger = LogContext(__name__)
 
+T = TypeVar("T")
+
+_FEED_ROW_COLUMNS = (Feeds.source_name, Feeds.name, Feeds.display_name)
+_FEED_CACHE_MAXSIZE = 256
+_PARSER_CACHE_MAXSIZE = 64
+
+# Successful fetch latencies per (source_name, feed_name). Kept per worker
+# process since a NewsClient only lives for one chunk, timeouts adapt once a
+# feed has enough samples
+_feed_latencies: DefaultDict[Tuple[str, str], LatencyWindow] = defaultdict(
+    LatencyWindow
+)
+_TIMEOUT_MIN_SAMPLES = 20
+_TIMEOUT_MIN = 1.0
+_TIMEOUT_MAX = 60.0
+# Feeds configured with their own timeout, used until latency samples exist
+_FEED_TIMEOUTS: Dict[Tuple[str, str], float] = {
+    (source_name, feed_name): feed_config["timeout_s"]
+    for source_name, source_config in RSS_FEEDS.items()
+    for feed_name, feed_config in source_config["feeds"].items()
+    if "timeout_s" in feed_config
+}
+
+# Signatures known to be stored, checked before Redis and the DB. Per worker
+# process like the latencies, an LRU so it holds the feeds' current items
+_seen_signatures: OrderedDict[str, bool] = OrderedDict()
+_SEEN_SIGNATURES_MAXSIZE = 20_000
+
+_GZIP_MAGIC = b"\x1f\x8b"
+# Compressed bodies at least this large are inflated in a worker thread
+_GUNZIP_IN_THREAD_MIN = 256 * 1024
+
+# Response validator header -> the request header that sends it back
+_VALIDATOR_HEADERS = {"etag": "If-None-Match", "last-modified": "If-Modified-Since"}
+
+# Errors that abort a whole feed batch instead of failing a single feed
+_FATAL_BATCH_ERRORS = (MemoryError,)
+
+# What the duplicate checks fail with while Redis or the database is unhealthy,
+# those fall back. Anything else is a bug and fails the feed it came from
+_REDIS_ERRORS = (RedisError, OSError, ServiceUnavailableError)
+_DB_ERRORS = (SQLAlchemyError, ServiceUnavailableError)
+# A dependency that is down fails the same way for every feed, log it once
+# a minute per error type instead of once per feed
+_error_log_throttle = LogThrottle(interval=60.0)
+
+# Hashes per Redis command, so a large batch doesn't hold one connection for long
+_REDIS_HASH_CHUNK = 128
+
+# Saves waiting on the background hash writer before new saves wait for it
+_HASH_QUEUE_MAXSIZE = 1000
+# Hashes the writer merges into one batch
+_HASH_WRITE_BATCH = 500
+
+# Signatures bound per existence query
+_DB_HASH_CHUNK = 500
+
+# Existing articles compared per (source, pub_date) in the title similarity check
+_SIMILARITY_CANDIDATE_LIMIT = 30
+
+# Core statement so a list of params runs as one executemany without the ORM
+_articles = Articles.__table__
+_UPDATE_CHANGED_TITLE = (
+    update(_articles)
+    .where(_articles.c.signature == bindparam("b_signature"))
+    .where(_articles.c.title != bindparam("b_title"))
+    .values(
+        title=bindparam("b_title"),
+        original_url=bindparam("b_original_url"),
+        updated_at=bindparam("b_updated_at"),
+    )
+)
+
+# Expanding IN keeps one cached compiled form no matter how many hashes are passed.
+# Signature is unique, so its index answers the lookup without touching rows
+_SELECT_EXISTING_SIGNATURES = select(Articles.signature).where(
+    Articles.signature.in_(bindparam("b_signatures", expanding=True))
+)
+
+
+def _lru_get(cache: OrderedDict, key: Any) -> Any:
+    """Look up key and mark it most recently used, None when missing"""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: OrderedDict, key: Any, value: Any, maxsize: int) -> None:
+    """Store key as most recently used, dropping the least recently used past maxsize"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+def _chunked(items: Set[str], size: int) -> List[List[str]]:
+    """Split items into lists of at most size"""
+    items = list(items)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _remember_signatures(signatures: Iterable[str]) -> None:
+    for signature in signatures:
+        _lru_put(_seen_signatures, signature, True, _SEEN_SIGNATURES_MAXSIZE)
+
+
+def _inflate(body: bytes) -> bytes:
+    """Content-Encoding deflate should be zlib wrapped, some servers send it raw"""
+    try:
+        return zlib.decompress(body)
+    except zlib.error:
+        return zlib.decompress(body, -zlib.MAX_WBITS)
+
+
+def _pub_date_key(article: Articles) -> datetime:
+    """Sort key for pub_date, offset-less dates are UTC like the parsers read them"""
+    pub_date = article.pub_date
+    if pub_date.tzinfo is None:
+        return pub_date.replace(tzinfo=timezone.utc)
+    return pub_date
+
+
+class FeedRow(NamedTuple):
+    """The feed columns needed to save articles, cached instead of ORM rows"""
+
+    source_name: str
+    name: str
+    display_name: Optional[str]
+
 
 class NewsClient:
     def __init__(
@@ -41,12 +204,35 @@ class NewsClient:
             self.connection_pool, health_service=health_service
         )
 
-        # Concurrency control
-        self._semaphore = asyncio.Semaphore(min(settings.MAX_CONCURRENT_REQUEST, 10))
+        # Concurrency control, number of feed workers per batch. Workers are
+        # admitted through a condition so the limit can change mid batch
+        self._max_concurrent_feeds = min(settings.MAX_CONCURRENT_REQUEST, 10)
+        self._active_feeds = 0
+        self._admit = asyncio.Condition()
+        # The session isn't thread safe, DB work runs in threads one at a time
+        self._db_lock = asyncio.Lock()
+        # Signatures saved by the running batch, published once it commits.
+        # None outside fetch_multiple_feeds, where every write commits itself
+        self._batch_hashes: Optional[List[str]] = None
+        # Feed validators of the running batch, stored once its articles commit
+        self._batch_validators: List[Tuple[str, Dict[str, str]]] = []
 
         # Caches
-        self._parser_cache = {}
-        self._feed_cache = {}
+        # Parsers hold per-source state, keep them bounded like the feed cache
+        self._parser_cache: OrderedDict[Tuple[type, str], FeedParser] = OrderedDict()
+        self._parser_dispatch: OrderedDict[Tuple[str, str], FeedParser] = OrderedDict()
+        # LRU of the few feed columns articles are saved against, not ORM rows
+        self._feed_cache: OrderedDict[Tuple[str, str], FeedRow] = OrderedDict()
+
+        # Duplicate checks from concurrently processed feeds share one round trip
+        self._redis_hash_batcher = KeyBatcher(self._redis_hash_batch, default=False)
+        self._db_hash_batcher = KeyBatcher(self._db_hash_batch, default=False)
+        # New hashes go to one background writer, which merges everything that
+        # queued up while its previous write was in flight
+        self._hash_queue: asyncio.Queue[List[str]] = asyncio.Queue(
+            maxsize=_HASH_QUEUE_MAXSIZE
+        )
+        self._hash_writer: Optional[asyncio.Task] = None
 
         # Set up circuit breakers if health service is provided
         self._circuit_breakers = {}
@@ -64,27 +250,29 @@ class NewsClient:
 
     def _init_circuit_breakers(self) -> None:
         """Initialize circuit breakers for various operations"""
+        # Probe again quickly after a trip, repeated failures double the
+        # timeout up to max_timeout and each open window is jittered
         circuit_configs = {
             "feed": {
                 "name": "news_feed_fetcher",
                 "failure_threshold": 3,
-                "reset_timeout": 30.0,
+                "reset_timeout": 0.5,
                 "backoff_multiplier": 2.0,
-                "max_timeout": 300.0,
+                "max_timeout": 60.0,
             },
             "redis": {
                 "name": "news_redis_cache",
                 "failure_threshold": 3,
-                "reset_timeout": 10.0,
-                "backoff_multiplier": 1.5,
+                "reset_timeout": 0.5,
+                "backoff_multiplier": 2.0,
                 "max_timeout": 60.0,
             },
             "db": {
                 "name": "news_db_operations",
                 "failure_threshold": 2,
-                "reset_timeout": 15.0,
+                "reset_timeout": 0.5,
                 "backoff_multiplier": 2.0,
-                "max_timeout": 120.0,
+                "max_timeout": 60.0,
             },
         }
 
@@ -98,6 +286,21 @@ class NewsClient:
             extra={"circuit_types": list(circuit_configs.keys())},
         )
 
+    async def set_max_concurrency(self, limit: int) -> None:
+        """
+        Change how many feeds may be fetched at once, e.g. while degraded
+
+        Lowering the limit takes effect as in-flight feeds finish. Raising it
+        is bounded by the workers the current batch started with, the next
+        batch starts as many workers as the new limit allows.
+
+        Args:
+            limit: Maximum concurrent feeds, at least 1
+        """
+        async with self._admit:
+            self._max_concurrent_feeds = max(1, limit)
+            self._admit.notify_all()
+
     def _get_circuit(self, circuit_type: str):
         """Get a circuit breaker by type"""
         return self._circuit_breakers.get(circuit_type)
@@ -107,8 +310,14 @@ class NewsClient:
         feeds: List[
             Tuple[str, str, str]
         ],  # Changed from (int, int, str) to (str, str, str)
+        feeds_from_db: bool = False,
     ) -> List[Tuple[int, Exception]]:
-        """Fetch multiple feeds in parallel with concurrency control"""
+        """
+        Fetch multiple feeds in parallel with concurrency control
+
+        Pass feeds_from_db=True when the (source_name, feed_name) pairs were just
+        read from the feeds table, they are then trusted instead of looked up again
+        """
         # Add operation information to correlation context
         add_correlation_id("operation", "fetch_multiple_feeds")
         add_correlation_id("feed_count", len(feeds))
@@ -122,51 +331,118 @@ class NewsClient:
             },
         )
 
-        # Prefetch feeds for efficiency
-        await self._prefetch_feeds([(source, feed) for source, feed, _ in feeds])
-
-        async def fetch_with_semaphore(source_name, feed_name, url):
-            async with self._semaphore:
-                try:
-                    # Add feed-specific context
-                    add_correlation_id("source_name", source_name)
-                    add_correlation_id("feed_name", feed_name)
-                    add_correlation_id("feed_url", url)
-
-                    with PerformanceLogger(
-                        logger, f"fetch_feed_{source_name}_{feed_name}"
-                    ):
-                        result = await self.fetch_headlines(source_name, feed_name, url)
-                        return result
-                except Exception as e:
-                    logger.error(
-                        "Error fetching headlines",
-                        extra={
-                            "error": str(e),
-                            "source_name": source_name,
-                            "feed_name": feed_name,
-                            "url": url,
-                            "error_type": e.__class__.__name__,
-                        },
-                    )
-                    self._update_health(
-                        f"feed_{source_name}_{feed_name}", "degraded", error=str(e)
+        if feeds_from_db:
+            for source_name, feed_name, _ in feeds:
+                if (source_name, feed_name) not in self._feed_cache:
+                    self._cache_feed(FeedRow(source_name, feed_name, None))
+        else:
+            # Prefetch feeds for efficiency
+            await self._prefetch_feeds([(source, feed) for source, feed, _ in feeds])
+
+        async def fetch_one(
+            source_name: str, feed_name: str, url: str
+        ) -> Tuple[int, Optional[BaseException]]:
+            # Always (article_count, error_or_None), per-feed errors never escape
+            try:
+                # Add feed-specific context
+                add_correlation_id("source_name", source_name)
+                add_correlation_id("feed_name", feed_name)
+                add_correlation_id("feed_url", url)
+
+                with PerformanceLogger(logger, f"fetch_feed_{source_name}_{feed_name}"):
+                    result = await self.fetch_headlines(source_name, feed_name, url)
+                    return result
+            except _FATAL_BATCH_ERRORS:
+                raise
+            except Exception as e:
+                logger.error(
+                    "Error fetching headlines",
+                    extra={
+                        "error": str(e),
+                        "source_name": source_name,
+                        "feed_name": feed_name,
+                        "url": url,
+                        "error_type": e.__class__.__name__,
+                    },
+                )
+                self._update_health(
+                    f"feed_{source_name}_{feed_name}", "degraded", error=str(e)
+                )
+                return 0, e
+
+        # A fixed pool of workers drains the feed queue, so only as many
+        # tasks exist as may run at once instead of one waiting task per feed
+        queue = asyncio.Queue()
+        for index, feed in enumerate(feeds):
+            queue.put_nowait((index, feed))
+        results = [None] * len(feeds)
+        success_count = 0
+        total_articles = 0
+
+        async def worker():
+            nonlocal success_count, total_articles
+            while not queue.empty():
+                index, (source_name, feed_name, url) = queue.get_nowait()
+                async with self._admit:
+                    await self._admit.wait_for(
+                        lambda: self._active_feeds < self._max_concurrent_feeds
                     )
-                    return 0, e
+                    self._active_feeds += 1
+                try:
+                    results[index] = await fetch_one(source_name, feed_name, url)
+                finally:
+                    async with self._admit:
+                        self._active_feeds -= 1
+                        self._admit.notify(1)
+                count, error = results[index]
+                # Tally as results come in rather than re-walking them afterwards
+                if error is None:
+                    success_count += 1
+                    total_articles += count
+
+        # Feeds write into savepoints of one transaction that is committed
+        # after the batch, one fsync for the chunk instead of one per feed
+        await self._run_db(self._begin_batch)
+        self._batch_hashes = []
+        self._batch_validators = []
+
+        # Per-feed errors come back as results, anything escaping a worker is
+        # fatal for the whole batch and the task group cancels the other workers
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(min(len(feeds), self._max_concurrent_feeds)):
+                    group.create_task(worker())
+        except ExceptionGroup as eg:
+            error = eg.exceptions[0]
+            # Keep what the finished feeds saved, the abort is what gets raised
+            with contextlib.suppress(Exception):
+                await self._commit_batch()
+            # Hashes the commit queued are written before the caller tears down
+            await self._flush_hash_writes()
+            logger.error(
+                "Batch feed fetch aborted",
+                extra={
+                    "error": str(error),
+                    "error_type": error.__class__.__name__,
+                    "feed_count": len(feeds),
+                    "completed_count": sum(1 for r in results if r is not None),
+                },
+            )
+            raise error from eg
+        except BaseException:
+            # Cancelled mid batch, e.g. by a task time limit. Don't leave the
+            # transaction open under the next batch on this client
+            await self._abort_batch()
+            raise
 
-        # Fetch all feeds concurrently with controlled concurrency
-        tasks = [
-            fetch_with_semaphore(source_name, feed_name, url)
-            for source_name, feed_name, url in feeds
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await self._commit_batch()
+
+        # Let hash writes queued by this batch finish before the caller moves
+        # on and closes the Redis client under them
+        await self._flush_hash_writes()
 
         # Calculate batch metrics
         total_duration = time.time() - feed_start_time
-        success_count = sum(1 for r in results if isinstance(r, tuple) and r[1] is None)
-        total_articles = sum(
-            r[0] if isinstance(r, tuple) and r[1] is None else 0 for r in results
-        )
 
         logger.info(
             "Batch feed fetch complete",
@@ -189,30 +465,35 @@ class NewsClient:
         if not feed_keys:
             return
 
-        unique_keys = list(set(feed_keys))
+        # Feeds cached by an earlier batch don't need another round trip
+        unique_keys = [key for key in set(feed_keys) if key not in self._feed_cache]
+        if not unique_keys:
+            return
 
         logger.debug("Prefetching feeds", extra={"feed_count": len(unique_keys)})
 
         async def fetch_feeds():
-            feeds = []
-            for source_name, feed_name in unique_keys:
-                feed = self.session.exec(
-                    select(Feeds).where(
-                        (Feeds.source_name == source_name) & (Feeds.name == feed_name)
+            # One query for every feed of the batch's sources, which also warms
+            # the cache for sibling feeds later batches are likely to ask for
+            source_names = {source_name for source_name, _ in unique_keys}
+            feeds = await self._run_db(
+                lambda: self.session.exec(
+                    select(*_FEED_ROW_COLUMNS).where(
+                        Feeds.source_name.in_(source_names)
                     )
-                ).first()
-                if feed:
-                    feeds.append(feed)
+                ).all()
+            )
 
-            for feed in feeds:
-                self._feed_cache[(feed.source_name, feed.name)] = feed
+            for row in feeds:
+                self._cache_feed(FeedRow._make(row))
 
+            found = sum(1 for key in unique_keys if key in self._feed_cache)
             logger.debug(
                 "Feeds prefetched",
                 extra={
                     "requested": len(unique_keys),
-                    "found": len(feeds),
-                    "missing": len(unique_keys) - len(feeds),
+                    "found": found,
+                    "missing": len(unique_keys) - found,
                 },
             )
 
@@ -255,22 +536,38 @@ class NewsClient:
         )
 
         try:
-            # Determine timeout based on URL
-            timeout = 1.0 if "longread" in url else settings.REQUEST_TIMEOUT
+            latencies = _feed_latencies[(source_name, feed_name)]
+            timeout = self._feed_timeout(latencies, source_name, feed_name)
+
+            # Validators from the last fetch, servers that support conditional
+            # GETs answer an unchanged feed with an empty 304
+            validators = await self.redis.get_feed_validators(url) if self.redis else {}
+            conditional_headers = {
+                _VALIDATOR_HEADERS[name]: value for name, value in validators.items()
+            }
 
             # If we have a circuit breaker, use it
             feed_circuit = self._get_circuit("feed")
 
+            fetch_start = time.monotonic()
             with PerformanceLogger(logger, f"fetch_raw_feed_{source_name}_{feed_name}"):
                 if feed_circuit:
                     raw_feed = await asyncio.wait_for(
-                        feed_circuit.execute(self._fetch_feed, url=url), timeout=timeout
+                        feed_circuit.execute(
+                            self._fetch_feed,
+                            url=url,
+                            timeout=timeout,
+                            conditional_headers=conditional_headers,
+                        ),
+                        timeout=timeout,
                     )
                 else:
                     # Original implementation without circuit breaker
                     raw_feed = await asyncio.wait_for(
-                        self._fetch_feed(url), timeout=timeout
+                        self._fetch_feed(url, timeout, conditional_headers),
+                        timeout=timeout,
                     )
+            latencies.add(time.monotonic() - fetch_start)
 
             # Process and save the articles
             with PerformanceLogger(logger, f"process_feed_{source_name}_{feed_name}"):
@@ -279,6 +576,11 @@ class NewsClient:
             with PerformanceLogger(logger, f"save_articles_{source_name}_{feed_name}"):
                 stats = await self._save_articles(articles, source_name, feed_name)
 
+            # Only remember validators once the articles are parsed and saved,
+            # both raise on failure. Otherwise the next poll would get a 304
+            # and the articles of this fetch would never be saved
+            await self._remember_validators(url, raw_feed[0], validators)
+
             # Update health status on success
             self._update_health(service_name, "operational")
 
@@ -306,6 +608,9 @@ class NewsClient:
                     "timeout": timeout,  # pyright: ignore[reportPossiblyUnboundVariable]
                 },
             )
+            # Count the timeout as a sample, otherwise a feed that slowed down
+            # would keep being judged against its old fast fetches
+            _feed_latencies[(source_name, feed_name)].add(timeout)  # pyright: ignore[reportPossiblyUnboundVariable]
             self._update_health(
                 service_name, "degraded", error=f"Timeout fetching feed: {url}"
             )
@@ -340,27 +645,47 @@ class NewsClient:
 
         self.health_service.update_service_health(service_name, **health_info)
 
-    async def _fetch_feed(self, url: str) -> Tuple[Any, bytes]:
+    @staticmethod
+    def _feed_timeout(
+        latencies: LatencyWindow, source_name: str, feed_name: str
+    ) -> float:
+        """Timeout of 1.5x the feed's recent p95 once enough fetches were seen"""
+        if len(latencies) < _TIMEOUT_MIN_SAMPLES:
+            return _FEED_TIMEOUTS.get(
+                (source_name, feed_name), settings.REQUEST_TIMEOUT
+            )
+        return min(_TIMEOUT_MAX, max(_TIMEOUT_MIN, 1.5 * latencies.percentile(0.95)))
+
+    async def _fetch_feed(
+        self,
+        url: str,
+        timeout: float = settings.REQUEST_TIMEOUT,
+        conditional_headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, bytes]:
         """Fetch feed contents with timeout protection"""
         logger.debug(f"Fetching feed from URL: {url}")
 
         try:
             response = await asyncio.wait_for(
-                self.http_client.request("GET", url), timeout=settings.REQUEST_TIMEOUT
+                self.http_client.request(
+                    "GET", url, conditional_headers=conditional_headers
+                ),
+                timeout=timeout,
             )
 
             headers, body = response
             content_length = len(body) if body else 0
 
-            logger.debug(
-                "Feed fetched successfully",
-                extra={
-                    "url": url,
-                    "status_code": headers.status_line,
-                    "content_type": headers.headers.get("Content-Type", "unknown"),
-                    "content_length": content_length,
-                },
-            )
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "Feed fetched successfully",
+                    extra={
+                        "url": url,
+                        "status_code": headers.status_line,
+                        "content_type": headers.get("content-type", "unknown"),
+                        "content_length": content_length,
+                    },
+                )
 
             return response
         except asyncio.TimeoutError as e:
@@ -370,49 +695,89 @@ class NewsClient:
                     "error": str(e),
                     "url": url,
                     "error_type": e.__class__.__name__,
-                    "timeout": settings.REQUEST_TIMEOUT,
+                    "timeout": timeout,
                 },
             )
             raise RSSFeedError(f"Timeout fetching feed: {url}")
 
+    async def _remember_validators(
+        self, url: str, headers: Any, previous: Dict[str, str]
+    ) -> None:
+        """Store the feed's ETag / Last-Modified for the next conditional GET"""
+        if not self.redis or headers.status_code != 200:
+            return
+
+        validators = {}
+        for name in _VALIDATOR_HEADERS:
+            value = headers.get(name)
+            if value:
+                validators[name] = value
+
+        if not validators or validators == previous:
+            return
+
+        if self._batch_hashes is not None:
+            # The articles aren't committed yet, a rolled back batch must
+            # fetch this feed in full again
+            self._batch_validators.append((url, validators))
+            return
+
+        await self.redis.set_feed_validators(url, validators)
+
     async def _process_feed(
         self, raw_feed: Tuple[Any, bytes], source_name: str
     ) -> List[Articles]:
         """Process feed content into article objects"""
         headers, body = raw_feed
-        content_type = headers.headers.get("Content-Type", "").lower()
-        if not content_type:
-            content_type = headers.headers.get("content-type", "").lower()
+        # Nothing to parse when the feed is unchanged or came back empty
+        if not body or headers.status_code == 304:
+            logger.debug(
+                "Feed not modified, skipping parse",
+                extra={"source_name": source_name, "status": headers.status_line},
+            )
+            return []
 
-        logger.debug(
-            "Processing feed content",
-            extra={
-                "source_name": source_name,
-                "content_type": content_type,
-                "content_length": len(body) if body else 0,
-            },
-        )
+        content_type = headers.get("content-type", "").lower()
+
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Processing feed content",
+                extra={
+                    "source_name": source_name,
+                    "content_type": content_type,
+                    "content_length": len(body) if body else 0,
+                },
+            )
 
         try:
-            # Handle gzip compression if present
-            content_encoding = headers.headers.get("Content-Encoding", "").lower()
-            if not content_encoding:
-                content_encoding = headers.headers.get("content-encoding", "").lower()
-            if "gzip" in content_encoding:
-                body = gzip.decompress(body)
-                logger.debug(
-                    "Decompressed gzipped content", extra={"source_name": source_name}
-                )
+            # Detect gzip by its magic bytes rather than Content-Encoding, some
+            # servers gzip without saying so and others label plain bodies gzip.
+            # Deflate has no reliable magic, so that one follows the header
+            if body[:2] == _GZIP_MAGIC:
+                decompress = gunzip
+            elif headers.get("content-encoding", "").lower() == "deflate":
+                decompress = _inflate
+            else:
+                decompress = None
+
+            if decompress is not None:
+                # Large bodies inflate off the loop, the inflate releases the GIL
+                if len(body) >= _GUNZIP_IN_THREAD_MIN:
+                    body = await asyncio.to_thread(decompress, body)
+                else:
+                    body = decompress(body)
+                logger.debug("Decompressed content", extra={"source_name": source_name})
 
-            # Convert bytes to string
+            parser = self._get_parser(content_type, source_name)
+
+            # Convert bytes to string unless the parser reads bytes directly
             content = (
                 body.decode("utf-8", errors="replace")
-                if isinstance(body, bytes)
+                if isinstance(body, bytes) and not parser.accepts_bytes
                 else body
             )
 
             # Parse content using appropriate parser
-            parser = self._get_parser(content_type, source_name)
             articles = await parser.parse_content(content)
 
             logger.debug(
@@ -432,30 +797,40 @@ class NewsClient:
                 },
             )
             self._update_health(f"feed_parser_{source_name}", "degraded", error=str(e))
-            return []
+            # Not an empty feed, the caller must not treat this fetch as ingested
+            raise
 
     def _get_parser(self, content_type: str, source_name: str) -> FeedParser:
         """Get or create an appropriate feed parser based on content type"""
-        cache_key = f"{content_type}_{source_name}"
-
-        # Return cached parser if available
-        if cache_key in self._parser_cache:
-            return self._parser_cache[cache_key]
-
-        # Create appropriate parser based on content type
-        if "xml" in content_type.lower():
-            parser = XMLFeedParser(source_name)
-            parser_type = "xml"
-        elif "json" in content_type.lower():
-            parser = JSONFeedParser(source_name)
-            parser_type = "json"
+        # A source sends the same few Content-Type values every time, so the
+        # exact header resolves straight to its parser after the first feed
+        dispatch_key = (content_type, source_name)
+        parser = _lru_get(self._parser_dispatch, dispatch_key)
+        if parser is not None:
+            return parser
+
+        content_type_lower = content_type.lower()
+        if "xml" in content_type_lower:
+            parser_class, parser_type = XMLFeedParser, "xml"
+        elif "json" in content_type_lower:
+            parser_class, parser_type = JSONFeedParser, "json"
         else:
+            parser_class, parser_type = XMLFeedParser, "xml_fallback"
+
+        # Keyed on the parser rather than the raw header, so charset and
+        # vendor variants of a content type share one parser per source
+        cache_key = (parser_class, source_name)
+        parser = _lru_get(self._parser_cache, cache_key)
+        if parser is not None:
+            _lru_put(self._parser_dispatch, dispatch_key, parser, _PARSER_CACHE_MAXSIZE)
+            return parser
+
+        if parser_type == "xml_fallback":
             logger.warning(
                 "Unknown content type. Trying XML parser",
                 extra={"content_type": content_type, "source_name": source_name},
             )
-            parser = XMLFeedParser(source_name)
-            parser_type = "xml_fallback"
+        parser = parser_class(source_name)
 
         logger.debug(
             "Created feed parser",
@@ -467,7 +842,8 @@ class NewsClient:
         )
 
         # Cache the parser for future use
-        self._parser_cache[cache_key] = parser
+        _lru_put(self._parser_cache, cache_key, parser, _PARSER_CACHE_MAXSIZE)
+        _lru_put(self._parser_dispatch, dispatch_key, parser, _PARSER_CACHE_MAXSIZE)
         return parser
 
     async def _save_articles(
@@ -482,7 +858,7 @@ class NewsClient:
             return 0
 
         # Get feed
-        feed = self._get_feed(source_name, feed_name)
+        feed = await self._get_feed(source_name, feed_name)
         if not feed:
             logger.warning(
                 "Feed not found",
@@ -503,7 +879,7 @@ class NewsClient:
 
         # Check for similar titles
         if new_articles:
-            new_articles = self._filter_by_title_similarity(
+            new_articles = await self._filter_by_title_similarity(
                 new_articles, existing_hashes, source_name, feed_name
             )
 
@@ -517,8 +893,9 @@ class NewsClient:
         self, articles: List[Articles], source_name: str, feed_name: str
     ) -> Tuple[List[Articles], Set[str]]:
         """Check which articles already exist by signature hash"""
-        # Extract signature hashes
-        hashes = {article.signature for article in articles if article.signature}
+        # Read each signature once, it's reused for the lookup and the filter
+        signatures = [article.signature for article in articles]
+        hashes = {signature for signature in signatures if signature}
 
         if not hashes:
             logger.warning(
@@ -531,41 +908,40 @@ class NewsClient:
             )
             return [], set()
 
-        logger.debug(
-            "Checking for duplicate articles",
-            extra={
-                "source_name": source_name,
-                "feed_name": feed_name,
-                "total_articles": len(articles),
-                "unique_hashes": len(hashes),
-            },
-        )
-
-        # Check Redis first for existing hashes
-        redis_hash_results = await self._check_hashes_in_redis(hashes)
-
-        # Check database for remaining hashes not found in Redis
-        hashes_to_check = {
-            h
-            for h in hashes
-            if h not in redis_hash_results or not redis_hash_results[h]
-        }
-
-        existing_db_hashes = await self._check_articles_exist_in_db(hashes_to_check)
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Checking for duplicate articles",
+                extra={
+                    "source_name": source_name,
+                    "feed_name": feed_name,
+                    "total_articles": len(articles),
+                    "unique_hashes": len(hashes),
+                },
+            )
 
-        # Combine Redis and DB results
-        existing_hashes = {
-            h
-            for h in hashes
-            if (h in redis_hash_results and redis_hash_results[h])
-            or h in existing_db_hashes
-        }
+        # Signatures this process already saw stored need no round trip at all,
+        # re-polls of an unchanged feed usually stop here
+        existing_hashes = {h for h in hashes if h in _seen_signatures}
+        hashes_to_check = hashes - existing_hashes
+
+        # Then Redis, and the database only for what Redis didn't have
+        if hashes_to_check:
+            redis_hash_results = await self._check_hashes_in_redis(hashes_to_check)
+            redis_hits = {h for h in hashes_to_check if redis_hash_results.get(h)}
+            existing_hashes |= redis_hits
+            hashes_to_check -= redis_hits
+
+            if hashes_to_check:
+                existing_hashes |= await self._check_articles_exist_in_db(
+                    hashes_to_check
+                )
+            _remember_signatures(existing_hashes)
 
         # Filter out existing articles
         new_articles = [
             article
-            for article in articles
-            if article.signature and article.signature not in existing_hashes
+            for article, signature in zip(articles, signatures)
+            if signature and signature not in existing_hashes
         ]
 
         return new_articles, existing_hashes
@@ -574,36 +950,33 @@ class NewsClient:
         self, articles: List[Articles], existing_hashes: Set[str]
     ) -> int:
         """Update any existing articles that have changed"""
-        # Get existing articles that match our hashes
-        existing_articles = self.session.exec(
-            select(Articles).where(Articles.signature.in_(existing_hashes))
-        ).all()
-
-        existing_by_hash = {article.signature: article for article in existing_articles}
-        new_by_hash = {
-            article.signature: article
+        # Last occurrence wins if a feed repeats a signature
+        changes = {
+            article.signature: {
+                "b_signature": article.signature,
+                "b_title": article.title,
+                "b_original_url": article.original_url,
+                "b_updated_at": article.updated_at,
+            }
             for article in articles
             if article.signature in existing_hashes
         }
+        if not changes:
+            return 0
 
-        articles_updated = 0
-        for hash, existing_article in existing_by_hash.items():
-            if hash in new_by_hash:
-                new_article = new_by_hash[hash]
-                if existing_article.title != new_article.title:
-                    existing_article.title = new_article.title
-                    existing_article.updated_at = new_article.updated_at
-                    existing_article.original_url = new_article.original_url
-                    self.session.add(existing_article)
-                    articles_updated += 1
+        def apply_updates() -> int:
+            # One executemany UPDATE, rows whose title is unchanged don't match
+            result = self.session.execute(_UPDATE_CHANGED_TITLE, list(changes.values()))
+            return max(result.rowcount, 0)
+
+        articles_updated = await self._run_db(lambda: self._write(apply_updates))
 
         if articles_updated:
-            self.session.commit()
             logger.info(
                 "Updated articles",
                 extra={
                     "articles_updated": articles_updated,
-                    "source_name": new_article.source_name,
+                    "source_name": articles[0].source_name,
                 },
             )
 
@@ -611,16 +984,14 @@ class NewsClient:
 
     def _deduplicate_by_signature(self, articles: List[Articles]) -> List[Articles]:
         """Deduplicate articles by signature, keeping earliest pub_date"""
-        unique_articles = {}
-        for article in articles:
-            if article.signature not in unique_articles:
-                unique_articles[article.signature] = article
-            elif article.pub_date < unique_articles[article.signature].pub_date:
-                unique_articles[article.signature] = article
-
+        # Latest first so the last write per signature is the earliest article.
+        # The sort is stable, reversing it keeps the first seen of equal dates
+        # Naive and aware dates can't be compared, so the key normalizes them
+        by_date = sorted(articles, key=_pub_date_key)
+        unique_articles = {article.signature: article for article in reversed(by_date)}
         return list(unique_articles.values())
 
-    def _filter_by_title_similarity(
+    async def _filter_by_title_similarity(
         self,
         articles: List[Articles],
         existing_hashes: Set[str],
@@ -628,20 +999,40 @@ class NewsClient:
         feed_name: str,
     ) -> List[Articles]:
         """Filter out articles with similar titles or identical URLs"""
-        duplicates = []
+        # Object ids, Articles compare field by field and aren't hashable
+        duplicates: Set[int] = set()
+
+        pending = [a for a in articles if a.signature not in existing_hashes]
+        if not pending:
+            return articles
+
+        # Candidates share the exact pub_date and source, fetch them for every
+        # article in one query instead of one round trip per article
+        keys = {(a.source_name, a.pub_date) for a in pending}
+        candidates_by_key: DefaultDict[tuple, List[Articles]] = defaultdict(list)
+        for candidate in await self._run_db(
+            lambda: self.session.exec(
+                select(Articles).where(
+                    tuple_(Articles.source_name, Articles.pub_date).in_(keys)
+                )
+            ).all()
+        ):
+            bucket = candidates_by_key[(candidate.source_name, candidate.pub_date)]
+            if len(bucket) < _SIMILARITY_CANDIDATE_LIMIT:
+                bucket.append(candidate)
+
+        # Candidates are shared by every article with the same key, index each
+        # candidate title once rather than for every comparison
+        matchers = {}
 
-        for article in articles[:]:
+        for article in pending:
             # Skip if already identified as a duplicate
             if article.signature in existing_hashes:
                 continue
 
-            # Find candidates with the exact same pub_date and source
-            candidates = self.session.exec(
-                select(Articles)
-                .where(Articles.source_name == article.source_name)
-                .where(Articles.pub_date == article.pub_date)
-                .limit(30)  # Increased limit to catch more potential duplicates
-            ).all()
+            candidates = candidates_by_key.get(
+                (article.source_name, article.pub_date), ()
+            )
 
             for candidate in candidates:
                 # Check URL first - identical URLs are almost certainly duplicates
@@ -655,10 +1046,14 @@ class NewsClient:
                             "source_name": article.source_name,
                         },
                     )
-                    duplicates.append(article)
+                    duplicates.add(id(article))
                     existing_hashes.add(article.signature)
                     break
 
+                if candidate.id not in matchers:
+                    matchers[candidate.id] = title_matcher(candidate.title)
+                similarity = matcher_similarity(matchers[candidate.id], article.title)
+
                 # Check author name if available
                 if (
                     article.author_name
@@ -666,9 +1061,6 @@ class NewsClient:
                     and article.author_name == candidate.author_name
                 ):
                     # Same author, same date - likely duplicate, use lower similarity threshold
-                    similarity = calculate_title_similarity(
-                        article.title, candidate.title
-                    )
                     if similarity > 0.6:  # Lower threshold when author matches
                         logger.info(
                             "Found duplicate by author match and moderate title similarity",
@@ -680,12 +1072,11 @@ class NewsClient:
                                 "source_name": article.source_name,
                             },
                         )
-                        duplicates.append(article)
+                        duplicates.add(id(article))
                         existing_hashes.add(article.signature)
                         break
 
                 # High title similarity check as before
-                similarity = calculate_title_similarity(article.title, candidate.title)
                 if similarity > 0.85:
                     logger.info(
                         "Found duplicate by high title similarity",
@@ -696,7 +1087,7 @@ class NewsClient:
                             "source_name": article.source_name,
                         },
                     )
-                    duplicates.append(article)
+                    duplicates.add(id(article))
                     existing_hashes.add(article.signature)
                     break
 
@@ -710,26 +1101,46 @@ class NewsClient:
                     "feed_name": feed_name,
                 },
             )
-            return [a for a in articles if a not in duplicates]
+            return [a for a in articles if id(a) not in duplicates]
 
         return articles
 
     async def _check_hashes_in_redis(self, hashes: Set[str]) -> Dict[str, bool]:
         """Check which content hashes exist in Redis"""
-        if not hashes:
+        if not hashes or not self.redis:
             return {}
 
         try:
-            start_time = time.time()
-            redis_circuit = self._get_circuit("redis")
-            if redis_circuit:
-                result = await redis_circuit.execute(
-                    self.redis.pipeline_check_hashes, list(hashes)
+            return await self._redis_hash_batcher.load(hashes)
+        except _REDIS_ERRORS as e:
+            suppressed = _error_log_throttle.allow(
+                f"redis_hash_check:{e.__class__.__name__}"
+            )
+            if suppressed is not None:
+                logger.warning(
+                    "Redis hash check failed. Falling back to DB",
+                    extra={
+                        "error": str(e),
+                        "error_type": e.__class__.__name__,
+                        "suppressed_count": suppressed,
+                    },
                 )
-            else:
-                result = await self.redis.pipeline_check_hashes(list(hashes))
+            return {}
 
-            duration_ms = (time.time() - start_time) * 1000
+    async def _redis_hash_batch(self, hashes: Set[str]) -> Dict[str, bool]:
+        """Check one batch of content hashes, collected across feeds, in Redis"""
+        start_time = time.time()
+        result = {}
+        for chunk_result in await asyncio.gather(
+            *(
+                self._call_redis(self.redis.pipeline_check_hashes, chunk)
+                for chunk in _chunked(hashes, _REDIS_HASH_CHUNK)
+            )
+        ):
+            result.update(chunk_result)
+
+        duration_ms = (time.time() - start_time) * 1000
+        if logger.is_enabled_for(logging.DEBUG):
             logger.debug(
                 "Redis hash check completed",
                 extra={
@@ -738,29 +1149,40 @@ class NewsClient:
                     "found_count": sum(1 for v in result.values() if v),
                 },
             )
-            return result
-        except Exception as e:
-            logger.warning(
-                "Redis hash check failed. Falling back to DB",
-                extra={"error": str(e), "error_type": e.__class__.__name__},
-            )
-            return {}
+        return result
 
-    async def _persist_articles(self, articles: List[Articles], feed: Feeds) -> int:
+    async def _persist_articles(self, articles: List[Articles], feed: FeedRow) -> int:
         """Persist articles to database with circuit breaker protection"""
         successful_articles = 0
 
+        def insert_rows() -> List[int]:
+            # Bulk insert the rows and their feed links instead of adding each
+            # article to the unit of work, ids come back in parameter order
+            article_ids = self.session.scalars(
+                insert(Articles).returning(Articles.id, sort_by_parameter_order=True),
+                [article.model_dump(exclude={"id"}) for article in articles],
+            ).all()
+            linked_at = datetime.now()
+            self.session.execute(
+                insert(ArticleFeeds),
+                [
+                    {
+                        "article_id": article_id,
+                        "feed_source_name": feed.source_name,
+                        "feed_name": feed.name,
+                        "created_at": linked_at,
+                    }
+                    for article_id in article_ids
+                ],
+            )
+            return article_ids
+
         async def save_articles():
             nonlocal successful_articles
-            new_hashes = []
-
-            for article in articles:
-                article.feeds.append(feed)
-                self.session.add(article)
-                new_hashes.append(article.signature)
-                successful_articles += 1
 
-            self.session.commit()
+            article_ids = await self._run_db(lambda: self._write(insert_rows))
+            successful_articles = len(article_ids)
+            new_hashes = [article.signature for article in articles]
             logger.info(
                 "Saved new articles to database",
                 extra={
@@ -770,8 +1192,14 @@ class NewsClient:
                 },
             )
 
-            # Add hashes to Redis asynchronously
-            asyncio.create_task(self._cache_article_hashes(new_hashes))
+            if self._batch_hashes is not None:
+                # Not committed yet, other processes can't see these rows
+                self._batch_hashes.extend(new_hashes)
+                return successful_articles
+
+            # Add hashes to Redis in the background
+            _remember_signatures(new_hashes)
+            await self._queue_hash_write(new_hashes)
             return successful_articles
 
         # Use circuit breaker if available
@@ -795,55 +1223,217 @@ class NewsClient:
                     "feed_name": feed.name,
                 },
             )
-            self.session.rollback()
+            # Inside a batch the savepoint already undid this feed's rows,
+            # rolling back the session would drop the other feeds too
+            if self._batch_hashes is None:
+                await self._run_db(self.session.rollback)
             self._update_health("news_db_operations", "degraded", error=str(e))
-            return 0
+            raise
+
+    async def _queue_hash_write(self, hashes: List[str]) -> None:
+        """Queue hashes for the background writer, waiting while the queue is full"""
+        if not hashes or not self.redis:
+            return
+
+        if self._hash_writer is None or self._hash_writer.done():
+            self._hash_writer = asyncio.create_task(self._hash_writer_loop())
+        await self._hash_queue.put(hashes)
+
+    async def _hash_writer_loop(self) -> None:
+        """Write queued hashes to Redis, merging queued saves into one batch"""
+        while True:
+            batch = list(await self._hash_queue.get())
+            taken = 1
+            while len(batch) < _HASH_WRITE_BATCH and not self._hash_queue.empty():
+                batch.extend(self._hash_queue.get_nowait())
+                taken += 1
+
+            try:
+                await self._cache_article_hashes(batch)
+            finally:
+                for _ in range(taken):
+                    self._hash_queue.task_done()
+
+    async def _flush_hash_writes(self) -> None:
+        """Wait for queued hashes to be written, then stop the writer"""
+        if self._hash_writer is None:
+            return
+
+        if not self._hash_writer.done():
+            await self._hash_queue.join()
+        self._hash_writer.cancel()
+        await asyncio.wait([self._hash_writer])
+        self._hash_writer = None
 
     async def _cache_article_hashes(self, hashes: List[str]) -> None:
         """Cache article hashes in Redis for future duplicate checks"""
         if not hashes or not self.redis:
             return
 
+        # Runs in the background writer, nothing above it to raise to
         try:
-            start_time = time.time()
-            redis_circuit = self._get_circuit("redis")
-            if redis_circuit:
-                await redis_circuit.execute(self.redis.pipeline_add_hashes, hashes)
-            else:
-                await self.redis.pipeline_add_hashes(hashes)
+            await self._redis_add_hash_batch(set(hashes))
+        except Exception as e:
+            suppressed = _error_log_throttle.allow(
+                f"redis_hash_add:{e.__class__.__name__}"
+            )
+            if suppressed is not None:
+                logger.error(
+                    "Failed to add hashes to Redis",
+                    extra={
+                        "error": str(e),
+                        "error_type": e.__class__.__name__,
+                        "suppressed_count": suppressed,
+                    },
+                    exc_info=True,
+                )
+
+    async def _redis_add_hash_batch(self, hashes: Set[str]) -> None:
+        """Add one batch of content hashes, collected across feeds, to Redis"""
+        start_time = time.time()
+        await asyncio.gather(
+            *(
+                self._call_redis(self.redis.pipeline_add_hashes, chunk)
+                for chunk in _chunked(hashes, _REDIS_HASH_CHUNK)
+            )
+        )
 
-            duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.time() - start_time) * 1000
+        if logger.is_enabled_for(logging.DEBUG):
             logger.debug(
                 "Cached article hashes in Redis",
                 extra={"hash_count": len(hashes), "duration_ms": round(duration_ms, 2)},
             )
+
+    def _write(self, fn: Callable[[], T]) -> T:
+        """Run session writes, committing them unless a batch is open"""
+        if self._batch_hashes is None:
+            result = fn()
+            self.session.commit()
+            return result
+
+        # A failing feed only rolls back its own savepoint
+        with self.session.begin_nested():
+            return fn()
+
+    def _begin_batch(self) -> None:
+        """Open the transaction the batch's savepoints nest in"""
+        connection = self.session.connection()
+        # pysqlite only begins at the first DML, until then releasing a
+        # savepoint commits it. Begin explicitly so the batch commits once
+        if (
+            connection.dialect.name == "sqlite"
+            and not connection.connection.driver_connection.in_transaction
+        ):
+            connection.exec_driver_sql("BEGIN")
+
+    async def _commit_batch(self) -> None:
+        """Commit the batch's writes, then publish the signatures it saved"""
+        hashes, self._batch_hashes = self._batch_hashes, None
+        validators, self._batch_validators = self._batch_validators, []
+        try:
+            await self._run_db(self.session.commit)
         except Exception as e:
             logger.error(
-                "Failed to add hashes to Redis",
-                extra={"error": str(e), "error_type": e.__class__.__name__},
+                "Error committing feed batch",
+                extra={
+                    "error": str(e),
+                    "error_type": e.__class__.__name__,
+                    "article_count": len(hashes or ()),
+                },
+            )
+            await self._abort_batch()
+            self._update_health("news_db_operations", "degraded", error=str(e))
+            raise
+
+        if hashes:
+            _remember_signatures(hashes)
+            await self._queue_hash_write(hashes)
+
+        if validators:
+            await asyncio.gather(
+                *(self.redis.set_feed_validators(url, v) for url, v in validators)
             )
 
+    async def _abort_batch(self) -> None:
+        """Roll back the batch's writes, its signatures were never published"""
+        self._batch_hashes = None
+        self._batch_validators = []
+        # Signatures seen during the batch may belong to rolled back rows
+        _seen_signatures.clear()
+        await self._run_db(self.session.rollback)
+
+    async def _run_db(self, fn: Callable[[], T]) -> T:
+        """Run blocking session work in a thread so other feeds keep going"""
+        async with self._db_lock:
+            work = asyncio.ensure_future(asyncio.to_thread(fn))
+            try:
+                return await asyncio.shield(work)
+            except asyncio.CancelledError:
+                # The thread can't be stopped, keep the session locked until
+                # it is done with it
+                await asyncio.wait([work])
+                raise
+
+    async def _call_redis(self, operation, *args):
+        """Run a Redis operation through the redis circuit breaker if there is one"""
+        redis_circuit = self._get_circuit("redis")
+        if redis_circuit:
+            return await redis_circuit.execute(operation, *args)
+        return await operation(*args)
+
     async def _check_articles_exist_in_db(self, hashes: Set[str]) -> Set[str]:
         """Check which content hashes already exist in database"""
         if not hashes:
             return set()
 
-        db_circuit = self._get_circuit("db")
         try:
-            start_time = time.time()
+            found = await self._db_hash_batcher.load(hashes)
+            return {h for h, exists in found.items() if exists}
+        except _DB_ERRORS as e:
+            suppressed = _error_log_throttle.allow(
+                f"db_hash_check:{e.__class__.__name__}"
+            )
+            if suppressed is not None:
+                logger.error(
+                    "DB hash check failed",
+                    extra={
+                        "error": str(e),
+                        "error_type": e.__class__.__name__,
+                        "hash_count": len(hashes),
+                        "suppressed_count": suppressed,
+                    },
+                    exc_info=True,
+                )
+            return set()
 
-            async def check_hashes():
-                results = self.session.exec(
-                    select(Articles.signature).where(Articles.signature.in_(hashes))
-                ).all()
-                return set(results)
+    async def _db_hash_batch(self, hashes: Set[str]) -> Dict[str, bool]:
+        """Check one batch of content hashes, collected across feeds, in the DB"""
+        start_time = time.time()
 
-            if db_circuit:
-                result = await db_circuit.execute(check_hashes)
-            else:
-                result = await check_hashes()
+        def select_existing() -> Set[str]:
+            # Hashes from a whole chunk of feeds can exceed SQLite's bound
+            # parameter limit, so large batches are looked up in slices
+            found = set()
+            for chunk in _chunked(hashes, _DB_HASH_CHUNK):
+                found.update(
+                    self.session.exec(
+                        _SELECT_EXISTING_SIGNATURES, params={"b_signatures": chunk}
+                    ).all()
+                )
+            return found
+
+        async def check_hashes():
+            return await self._run_db(select_existing)
+
+        db_circuit = self._get_circuit("db")
+        if db_circuit:
+            result = await db_circuit.execute(check_hashes)
+        else:
+            result = await check_hashes()
 
-            duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.time() - start_time) * 1000
+        if logger.is_enabled_for(logging.DEBUG):
             logger.debug(
                 "DB hash check completed",
                 extra={
@@ -852,34 +1442,27 @@ class NewsClient:
                     "found_count": len(result),
                 },
             )
+        return {h: True for h in result}
 
-            return result
-        except Exception as e:
-            logger.error(
-                "DB hash check failed",
-                extra={
-                    "error": str(e),
-                    "error_type": e.__class__.__name__,
-                    "hash_count": len(hashes),
-                },
-            )
-            return set()
-
-    def _get_feed(self, source_name: str, feed_name: str) -> Optional[Feeds]:
+    async def _get_feed(self, source_name: str, feed_name: str) -> Optional[FeedRow]:
         """Get feed by composite key, using cache if available"""
         cache_key = (source_name, feed_name)
-        if cache_key in self._feed_cache:
-            return self._feed_cache[cache_key]
+        feed = _lru_get(self._feed_cache, cache_key)
+        if feed is not None:
+            return feed
 
         # If not in cache, fetch from database
-        feed = self.session.exec(
-            select(Feeds).where(
-                (Feeds.source_name == source_name) & (Feeds.name == feed_name)
-            )
-        ).first()
+        row = await self._run_db(
+            lambda: self.session.exec(
+                select(*_FEED_ROW_COLUMNS).where(
+                    (Feeds.source_name == source_name) & (Feeds.name == feed_name)
+                )
+            ).first()
+        )
+        feed = FeedRow._make(row) if row else None
 
         if feed:
-            self._feed_cache[cache_key] = feed
+            self._cache_feed(feed)
             logger.debug(
                 "Feed fetched from database and cached",
                 extra={
@@ -896,6 +1479,10 @@ class NewsClient:
 
         return feed
 
+    def _cache_feed(self, feed: FeedRow) -> None:
+        key = (feed.source_name, feed.name)
+        _lru_put(self._feed_cache, key, feed, _FEED_CACHE_MAXSIZE)
+
     async def _log_error(
         self, error: Exception, start_time: float, source_name: str, feed_name: str
     ) -> None:
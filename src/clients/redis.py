@@ -472,13 +472,14 @@ class RedisClient:
                 return {hash: False for hash in content_hashes}
 
             with PerformanceLogger(logger, f"redis_pipeline_check_hashes_{hash_count}"):
-                result = {}
-                async with self.redis.pipeline(transaction=False) as pipe:
-                    for content_hash in content_hashes:
-                        pipe.exists(f"hash:{content_hash}")
-                    responses = await pipe.execute()
-                    for i, content_hash in enumerate(content_hashes):
-                        result[content_hash] = bool(responses[i])
+                # One MGET instead of a pipeline of per-key EXISTS commands
+                responses = await self.redis.mget(
+                    [f"hash:{content_hash}" for content_hash in content_hashes]
+                )
+                result = {
+                    content_hash: response is not None
+                    for content_hash, response in zip(content_hashes, responses)
+                }
 
                 # Calculate hit rate for metrics
                 hits = sum(1 for v in result.values() if v)
@@ -532,6 +533,62 @@ class RedisClient:
                 )
                 return {hash: False for hash in content_hashes}
 
+    async def get_feed_validators(self, url: str) -> Dict[str, str]:
+        """Get the ETag / Last-Modified stored for a feed URL, empty if unknown"""
+
+        async def _operation():
+            if self.redis is None:
+                await self.initialize()
+
+            if self.redis is None:
+                return {}
+
+            data = await self.redis.get(f"feed_validators:{url}")
+            return json.loads(data) if data else {}
+
+        async def _fallback(*args, **kwargs):
+            return {}
+
+        try:
+            if self._circuit_breaker:
+                return await self._circuit_breaker.execute(
+                    lambda: _operation(), fallback=_fallback
+                )
+            return await _operation()
+        except Exception as e:
+            logger.warning(
+                "Redis feed validator lookup failed",
+                extra={"error": str(e), "url": url, "error_type": e.__class__.__name__},
+            )
+            return {}
+
+    async def set_feed_validators(
+        self, url: str, validators: Dict[str, str], expire: int = 86400
+    ) -> None:
+        """Store the ETag / Last-Modified a feed URL last answered with"""
+
+        async def _operation():
+            if self.redis is None:
+                await self.initialize()
+
+            if self.redis is None:
+                return
+
+            await self.redis.set(
+                f"feed_validators:{url}", json.dumps(validators), ex=expire
+            )
+
+        try:
+            if self._circuit_breaker:
+                await self._circuit_breaker.execute(lambda: _operation())
+            else:
+                await _operation()
+        except Exception as e:
+            logger.warning(
+                "Redis feed validator update failed",
+                extra={"error": str(e), "url": url, "error_type": e.__class__.__name__},
+            )
+
     async def keys(self, pattern: str) -> List[str]:
         """
         Get all keys matching a pattern
@@ -19,7 +19,11 @@ RSS_FEEDS: Dict[str, FeedConfig] = {
             "finans": {"path": "/rss/finans", "display_name": "Finans"},
             "investor": {"path": "/rss/investor", "display_name": "Investor"},
             "ledelse": {"path": "/rss/executive", "display_name": "Ledelse"},
-            "longread": {"path": "/rss/longread", "display_name": "Long Read"},
+            "longread": {
+                "path": "/rss/longread",
+                "display_name": "Long Read",
+                "timeout_s": 1.0,
+            },
             "markedsberetninger": {
                 "path": "/rss/markedsberetninger",
                 "display_name": "Markedsberetninger",
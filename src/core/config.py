@@ -57,6 +57,7 @@ class Settings(BaseSettings):
     POOL_SIZE: int = 10
     MAX_CONCURRENT_REQUEST: int = 16
     REQUEST_TIMEOUT: int = 30
+    HTTP_MAX_TRACKED_HOSTS: int = 1024
 
     # Performance
     WORKER_CONCURRENCY: int = 8
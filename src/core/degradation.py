@@ -1,7 +1,9 @@
 import time
 import asyncio
+import random
+from collections import OrderedDict
 from enum import Enum
-from typing import Dict, Any, Callable, Awaitable, TypeVar
+from typing import Dict, Any, Callable, Awaitable, TypeVar, Tuple
 
 from src.core.exceptions import ServiceUnavailableError
 from src.core.logging import LogContext, PerformanceLogger, add_correlation_id
@@ -11,6 +13,8 @@ logger = LogContext(__name__)
 T = TypeVar("T")
 F = TypeVar("F")
 
+_MISSING = object()
+
 
 class ServiceState(str, Enum):
     """Service health states"""
@@ -94,19 +98,33 @@ class CircuitBreaker:
         backoff_multiplier: float = 2.0,
         max_timeout: float = 3600.0,
         health_service: "HealthService" = None,
+        cache_ttl: float = 300.0,
+        cache_maxsize: int = 1024,
+        jitter: bool = True,
     ):
         self.name = name
         self.failure_threshold = failure_threshold
         self.reset_timeout = reset_timeout
         self.backoff_multiplier = backoff_multiplier
         self.max_timeout = max_timeout
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self.jitter = jitter
 
         # state tracking
         self.state = CircuitState.CLOSED
         self.failure_count = 0
+        # last_failure_time is wall clock for reporting, the monotonic copy
+        # drives the open timeout so clock jumps can't stretch or skip it
         self.last_failure_time = 0
+        self._last_failure_monotonic = 0.0
         self.current_timeout = reset_timeout
-        self.cache = {}
+        # how long the current open period lasts, current_timeout with jitter
+        self.open_window = reset_timeout
+
+        # LRU cache for fallback data, entries are (value, expires_at) on the
+        # monotonic clock so stale results age out instead of being served forever
+        self.cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
 
         # reference to health service for reporting
         self.health_service = health_service
@@ -123,12 +141,33 @@ class CircuitBreaker:
             },
         )
 
+    def _get_cached(self, cache_key: str) -> Any:
+        """Return cached value or _MISSING, evicting it lazily if expired"""
+        entry = self.cache.get(cache_key)
+        if entry is None:
+            return _MISSING
+
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self.cache[cache_key]
+            return _MISSING
+
+        self.cache.move_to_end(cache_key)
+        return value
+
+    def _set_cached(self, cache_key: str, value: Any) -> None:
+        """Store value with a fresh expiry, evicting least recently used entries"""
+        self.cache[cache_key] = (value, time.monotonic() + self.cache_ttl)
+        self.cache.move_to_end(cache_key)
+        while len(self.cache) > self.cache_maxsize:
+            self.cache.popitem(last=False)
+
     async def execute(
         self,
         func: Callable[..., Awaitable[T]],
+        *args: Any,
         cache_key: str | None = None,
         fallback: Callable[..., Awaitable[F]] | None = None,
-        *args: Any,
         **kwargs: Any,
     ) -> T:
         """
@@ -136,9 +175,10 @@ class CircuitBreaker:
 
         Args:
             func: Async function to execute
-            cache_key: Optional key for caching results
-            fallback: Optional fallback function to call if circuit is open
-            *args, **kwargs: Arguments to pass to the function
+            *args, **kwargs: Arguments to pass to the function and the fallback
+            cache_key: Optional key for caching results, keyword-only
+            fallback: Optional fallback function to call if circuit is open,
+                keyword-only
 
         Returns:
             Result of the function call or fallback
@@ -167,11 +207,12 @@ class CircuitBreaker:
 
         # check if circuit is open
         if self.state == CircuitState.OPEN:
-            time_since_failure = time.time() - self.last_failure_time
+            time_since_failure = time.monotonic() - self._last_failure_monotonic
 
             # if we havent waited long enough
-            if time_since_failure < self.current_timeout:
-                if use_cache and cache_key in self.cache:
+            if time_since_failure < self.open_window:
+                cached = self._get_cached(cache_key) if use_cache else _MISSING
+                if cached is not _MISSING:
                     logger.info(
                         "Circuit is OPEN - using cached data",
                         extra={
@@ -181,11 +222,11 @@ class CircuitBreaker:
                             "time_since_failure_s": round(time_since_failure, 2),
                             "current_timeout_s": self.current_timeout,
                             "retry_after_s": round(
-                                self.current_timeout - time_since_failure, 2
+                                self.open_window - time_since_failure, 2
                             ),
                         },
                     )
-                    return self.cache[cache_key]
+                    return cached
 
                 if fallback:
                     logger.info(
@@ -197,14 +238,14 @@ class CircuitBreaker:
                             "time_since_failure_s": round(time_since_failure, 2),
                             "current_timeout_s": self.current_timeout,
                             "retry_after_s": round(
-                                self.current_timeout - time_since_failure, 2
+                                self.open_window - time_since_failure, 2
                             ),
                         },
                     )
                     with PerformanceLogger(logger, f"circuit_fallback_{self.name}"):
                         return await fallback(*args, **kwargs)
 
-                retry_after = int(self.current_timeout - time_since_failure)
+                retry_after = int(self.open_window - time_since_failure)
                 logger.warning(
                     "Circuit is OPEN - no fallback available",
                     extra={
@@ -257,7 +298,7 @@ class CircuitBreaker:
                 )
 
             if use_cache:
-                self.cache[cache_key] = result
+                self._set_cached(cache_key, result)
                 logger.debug(
                     "Circuit cached result",
                     extra={"circuit_name": self.name, "cache_key": cache_key},
@@ -268,6 +309,7 @@ class CircuitBreaker:
         except Exception as e:
             self.failure_count += 1
             self.last_failure_time = time.time()
+            self._last_failure_monotonic = time.monotonic()
 
             logger.error(
                 "Circuit protected operation failed",
@@ -285,7 +327,7 @@ class CircuitBreaker:
                 self.state == CircuitState.CLOSED
                 and self.failure_count >= self.failure_threshold
             ):
-                self.state = CircuitState.OPEN
+                self._open()
                 logger.warning(
                     "Circuit OPEN - threshold reached",
                     extra={
@@ -293,15 +335,15 @@ class CircuitBreaker:
                         "state": self.state,
                         "failure_threshold": self.failure_threshold,
                         "failure_count": self.failure_count,
-                        "timeout_s": self.current_timeout,
+                        "timeout_s": self.open_window,
                     },
                 )
             elif self.state == CircuitState.HALF_OPEN:
-                self.state = CircuitState.OPEN
                 prev_timeout = self.current_timeout
                 self.current_timeout = min(
                     self.current_timeout * self.backoff_multiplier, self.max_timeout
                 )
+                self._open()
                 logger.warning(
                     "Circuit OPEN - test failed",
                     extra={
@@ -315,7 +357,8 @@ class CircuitBreaker:
 
             self._update_health(str(e))
 
-            if use_cache and cache_key in self.cache:
+            cached = self._get_cached(cache_key) if use_cache else _MISSING
+            if cached is not _MISSING:
                 logger.info(
                     "Using cached data after failure",
                     extra={
@@ -324,7 +367,7 @@ class CircuitBreaker:
                         "function": function_name,
                     },
                 )
-                return self.cache[cache_key]
+                return cached
 
             if fallback:
                 logger.info(
@@ -347,6 +390,19 @@ class CircuitBreaker:
 
             raise
 
+    def _open(self):
+        """
+        Open the circuit for the current timeout
+
+        With jitter the window is drawn from [timeout / 2, timeout] so breakers
+        in different workers that tripped together don't probe in lockstep
+        """
+        self.state = CircuitState.OPEN
+        timeout = self.current_timeout
+        if self.jitter:
+            timeout = random.uniform(timeout / 2, timeout)
+        self.open_window = timeout
+
     def _reset(self):
         """Reset circuit to closed state"""
         prev_state = self.state
@@ -383,7 +439,7 @@ class CircuitBreaker:
 
         retry_at = 0
         if self.state == CircuitState.OPEN:
-            retry_at = self.last_failure_time + self.current_timeout
+            retry_at = self.last_failure_time + self.open_window
 
         logger.debug(
             "Updating health service",
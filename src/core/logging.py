@@ -63,6 +63,13 @@ class LogContext:
             logging.getLogger(logger_name) if logger_name else logging.getLogger()
         )
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether a message at level would be logged, so callers can skip
+        building expensive extra dicts for disabled levels
+        """
+        return self.logger.isEnabledFor(level)
+
     def info(self, message: str, extra: Dict[str, Any] | None = None) -> None:
         """
         Log an info message with correlation context
@@ -105,6 +112,9 @@ class LogContext:
         """
         Internal method to combine correlation context with extra data and log
         """
+        if not self.logger.isEnabledFor(level):
+            return
+
         if extra is None:
             extra = {}
 
@@ -192,6 +202,37 @@ class PerformanceLogger:
             )
 
 
+class LogThrottle:
+    """
+    Let one log record per key through every interval seconds
+
+    Meant for failures that repeat on every call while a dependency is down,
+    where logging each one only floods the log pipeline.
+    """
+
+    def __init__(self, interval: float = 60.0):
+        self.interval = interval
+        self._last_logged: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = {}
+
+    def allow(self, key: str) -> Optional[int]:
+        """
+        Check whether a record for key may be logged now
+
+        Returns:
+            Optional[int]: None if the record should be dropped, otherwise how
+            many records for key were dropped since the last one logged
+        """
+        now = time.monotonic()
+        last = self._last_logged.get(key)
+        if last is not None and now - last < self.interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return None
+
+        self._last_logged[key] = now
+        return self._suppressed.pop(key, 0)
+
+
 def setup_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(settings.LOG_LEVEL)
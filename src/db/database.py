@@ -2,6 +2,7 @@ import threading
 from tenacity import retry, stop_after_attempt, wait_exponential
 from typing import Annotated
 from fastapi import Depends
+from sqlalchemy import event
 from sqlmodel import QueuePool, Session, create_engine, text
 from src.core.config import settings
 from src.core.logging import LogContext
@@ -17,6 +18,13 @@ class DatabaseConnectionError(Exception):
     pass
 
 
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """SQLite ignores foreign keys unless every connection turns them on"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 @retry(
     stop=stop_after_attempt(5),
     wait=wait_exponential(multiplier=1, min=1, max=10),
@@ -36,6 +44,10 @@ def get_engine():
                 pool_pre_ping=True,
                 echo=False,
             )
+            if _engine_store.engine.dialect.name == "sqlite":
+                event.listen(
+                    _engine_store.engine, "connect", enable_sqlite_foreign_keys
+                )
             # test connection
             with _engine_store.engine.connect() as conn:
                 conn.execute(text("SELECT 1")).scalar()
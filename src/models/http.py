@@ -1,20 +1,123 @@
-from pydantic import BaseModel
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
-class HTTPHeaders(BaseModel):
-    status_line: str
-    headers: Dict[str, str]
+class HTTPHeaders:
+    """
+    Response status line and headers, header names are lowercased
+
+    Headers parsed from bytes are kept as the raw header block. Single
+    lookups via get() scan that block directly, and the full headers dict
+    is only built when it is first accessed. Both follow the same rule: the
+    value is everything after the first colon, stripped, and the last of
+    repeated headers wins.
+    """
+
+    __slots__ = (
+        "status_line",
+        "status_code",
+        "_headers",
+        "_set_cookies",
+        "_raw",
+        "_raw_lower",
+    )
+
+    def __init__(
+        self,
+        status_line: str,
+        headers: Optional[Dict[str, str]] = None,
+        set_cookies: Optional[List[str]] = None,
+        raw: bytes = b"",
+    ):
+        self.status_line = status_line
+        # "HTTP/1.1 200 OK" -> 200, parsed once for the framing checks
+        parts = status_line.split(" ", 2)
+        self.status_code = int(parts[1]) if len(parts) > 1 else 0
+        self._headers = headers
+        self._set_cookies = set_cookies
+        self._raw = raw
+        self._raw_lower: Optional[bytes] = None
 
     @classmethod
     def from_bytes(cls, header_data: bytes) -> "HTTPHeaders":
-        header_lines = header_data.split(b"\r\n")
+        end = header_data.find(b"\r\n")
+        if end < 0:
+            return cls(status_line=header_data.decode(), headers={}, set_cookies=[])
+        return cls(status_line=header_data[:end].decode(), raw=header_data[end:])
+
+    @classmethod
+    def from_items(
+        cls, status_line: str, items: Iterable[Tuple[str, str]]
+    ) -> "HTTPHeaders":
+        """Build from already parsed (name, value) pairs, e.g. another client's"""
         headers = {}
-        status_line = header_lines[0].decode()
+        set_cookies = []
+        for key, value in items:
+            key = key.lower()
+            headers[key] = value
+            if key == "set-cookie":
+                set_cookies.append(value)
+        return cls(status_line=status_line, headers=headers, set_cookies=set_cookies)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        if self._headers is None:
+            self._parse()
+        return self._headers
+
+    @property
+    def set_cookies(self) -> List[str]:
+        if self._set_cookies is None:
+            self._parse()
+        return self._set_cookies
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Case-insensitive lookup of a single header without building the dict"""
+        if self._headers is not None:
+            return self._headers.get(name.lower(), default)
+
+        if self._raw_lower is None:
+            self._raw_lower = self._raw.lower()
+
+        # Last occurrence, the same one the parsed dict ends up keeping
+        needle = b"\r\n" + name.lower().encode() + b":"
+        start = self._raw_lower.rfind(needle)
+        if start < 0:
+            return default
+
+        start += len(needle)
+        end = self._raw.find(b"\r\n", start)
+        if end < 0:
+            end = len(self._raw)
+        return self._raw[start:end].decode().strip()
+
+    def _parse(self) -> None:
+        headers = {}
+        set_cookies = []
+
+        for line in self._raw.split(b"\r\n"):
+            # The space after the colon is optional, ETag:"x" is a valid line
+            if b":" in line:
+                key, value = line.decode().split(":", 1)
+                key = key.strip().lower()
+                value = value.strip()
+                headers[key] = value
+                # Set-Cookie can't be folded into one value, so keep every line
+                if key == "set-cookie":
+                    set_cookies.append(value)
+
+        self._headers = headers
+        self._set_cookies = set_cookies
 
-        for line in header_lines[1:]:
-            if b": " in line:
-                key, value = line.decode().split(": ", 1)
-                headers[key.strip()] = value.strip()
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HTTPHeaders):
+            return NotImplemented
+        return (
+            self.status_line == other.status_line
+            and self.headers == other.headers
+            and self.set_cookies == other.set_cookies
+        )
 
-        return cls(status_line=status_line, headers=headers)
+    def __repr__(self) -> str:
+        return (
+            f"HTTPHeaders(status_line={self.status_line!r}, headers={self.headers!r})"
+        )
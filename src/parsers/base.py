@@ -12,6 +12,9 @@ EMAIL_PATTERN = re.compile(r"([\w\.-]+@[\w\.-]+\.\w+)\s*\(([^)]+)\)")
 
 
 class FeedParser(ABC):
+    # Parsers that take raw response bytes skip the utf-8 decode in NewsClient
+    accepts_bytes: bool = False
+
     def __init__(self, source_name: str):
         self.source_name = source_name
 
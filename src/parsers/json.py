@@ -2,17 +2,40 @@ from src.core.logging import LogContext, PerformanceLogger
 from .base import FeedParser
 from typing import List, Dict, Optional, Any
 from src.models.db_models import Articles
-import json
+import orjson
 from datetime import datetime, timezone
+from functools import lru_cache
 from src.constants import JSON_FIELD_MAPPINGS
 
 logger = LogContext(__name__)
 
+DATE_PARSERS = (
+    # Standard ISO format
+    lambda s: datetime.fromisoformat(s.replace("Z", "+00:00")),
+    # Format with milliseconds: 2025-05-02T06:27:28.003
+    lambda s: datetime.strptime(s.split(".")[0], "%Y-%m-%dT%H:%M:%S"),
+    # Standard datetime format
+    lambda s: datetime.strptime(s, "%Y-%m-%d %H:%M:%S"),
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_known_date(date_str: str) -> Optional[datetime]:
+    """Parse with the first format that fits, feeds repeat dates across polls"""
+    for format_parser in DATE_PARSERS:
+        try:
+            return format_parser(date_str)
+        except (ValueError, TypeError):
+            continue
+    return None
+
 
 class JSONFeedParser(FeedParser):
-    async def parse_content(self, content: str) -> List[Articles]:
+    accepts_bytes = True
+
+    async def parse_content(self, content: str | bytes) -> List[Articles]:
         with PerformanceLogger(logger, f"json_parse_source_{self.source_name}"):
-            json_content = json.loads(content)
+            json_content = orjson.loads(content)
             return await self._parse_json_response(json_content)
 
     async def _parse_json_response(
@@ -146,17 +169,5 @@ class JSONFeedParser(FeedParser):
             return None
 
     def _parse_date(self, date_str: str) -> datetime:
-        date_formats = [
-            # Standard ISO format
-            lambda s: datetime.fromisoformat(s.replace("Z", "+00:00")),
-            # Format with milliseconds: 2025-05-02T06:27:28.003
-            lambda s: datetime.strptime(s.split(".")[0], "%Y-%m-%dT%H:%M:%S"),
-            # Standard datetime format
-            lambda s: datetime.strptime(s, "%Y-%m-%d %H:%M:%S"),
-        ]
-        for format_parser in date_formats:
-            try:
-                return format_parser(date_str)
-            except (ValueError, TypeError):
-                continue
-        return datetime.now(timezone.utc)
+        parsed = _parse_known_date(date_str)
+        return parsed if parsed is not None else datetime.now(timezone.utc)
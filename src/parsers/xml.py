@@ -1,3 +1,4 @@
+import asyncio
 from src.core.logging import LogContext, PerformanceLogger
 from .base import FeedParser
 import xml.etree.ElementTree as ET
@@ -7,10 +8,13 @@ import html
 from email.utils import parsedate_to_datetime
 from datetime import timezone, datetime
 import re
+from functools import lru_cache
 
 logger = LogContext(__name__)
 
 CDATA_PATTERN = re.compile(r"<!\[CDATA\[(.*?)\]\]>")
+# Bytes fed to the pull parser between draining its events
+FEED_CHUNK_SIZE = 64 * 1024
 NAMESPACES = {
     "media": "http://search.yahoo.com/mrss/",
     "dc": "http://purl.org/dc/elements/1.1/",
@@ -18,10 +22,45 @@ NAMESPACES = {
     "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",  # Required for DW feeds
     "dwsyn": "http://rss.dw.com/syndication/dwsyn/",  # DW-specific namespace
 }
+# Namespaced tags in Clark notation. Descendant lookups go through iter(),
+# which walks the subtree in C, find(".//dc:creator") runs ElementPath's
+# Python path engine for every item
+DC_CREATOR = f"{{{NAMESPACES['dc']}}}creator"
+DC_DATE = f"{{{NAMESPACES['dc']}}}date"
+CONTENT_ENCODED = f"{{{NAMESPACES['content']}}}encoded"
+
+DATE_PARSERS = (
+    # RFC 2822 (standard email date format)
+    lambda s: parsedate_to_datetime(s).astimezone(timezone.utc),
+    # ISO 8601 format with Z for UTC
+    lambda s: datetime.fromisoformat(s.replace("Z", "+00:00")),
+    # Common date-time formats
+    lambda s: datetime.strptime(s, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc),
+    lambda s: datetime.strptime(s, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc),
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_known_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a feed date with the first format that fits, None if none do
+
+    Feeds repeat the same items on every poll, so most dates are cache hits
+    instead of another pass through the pure Python email date parser.
+    """
+    for parse_func in DATE_PARSERS:
+        try:
+            return parse_func(date_str)
+        except (ValueError, TypeError):
+            continue
+    return None
 
 
 class XMLFeedParser(FeedParser):
-    async def parse_content(self, content: str) -> List[Articles]:
+    # expat picks the encoding from the XML declaration when given bytes
+    accepts_bytes = True
+
+    async def parse_content(self, content: str | bytes) -> List[Articles]:
         with PerformanceLogger(logger, f"xml_parse_source_name_{self.source_name}"):
             # Register common NAMESPACES to make parsing easier
 
@@ -30,8 +69,15 @@ class XMLFeedParser(FeedParser):
                 ET.register_namespace(prefix, uri)
 
             try:
-                tree = ET.fromstring(content)
-                return await self._parse_xml_response(tree)
+                try:
+                    return await self._parse_xml_stream(content)
+                except ET.ParseError:
+                    if not isinstance(content, bytes):
+                        raise
+                    # body doesn't match its declared encoding, parse it leniently
+                    return await self._parse_xml_stream(
+                        content.decode("utf-8", errors="replace")
+                    )
             except ET.ParseError as e:
                 logger.error(
                     "XML parsing error",
@@ -42,33 +88,65 @@ class XMLFeedParser(FeedParser):
                 )
                 return []
 
-    async def _parse_xml_response(self, tree: ET.Element) -> List[Articles]:
-        articles_to_return = []
-
-        # Look for items in various RSS/Atom formats
-        for item in tree.findall(".//item"):
-            article = await self._create_article_from_xml_item(item)
-            if article:
-                articles_to_return.append(article)
-
-        # If no items found via //item, try looking for entries (Atom format)
-        if not articles_to_return:
-            for entry in tree.findall(".//entry"):
-                article = await self._create_article_from_xml_item(entry)
-                if article:
-                    articles_to_return.append(article)
+    async def _parse_xml_stream(self, content: str | bytes) -> List[Articles]:
+        """
+        Build articles from each item as soon as the parser has closed it
+
+        The document is fed to a pull parser in chunks and every finished
+        <item> or <entry> is cleared once used, so the full tree of a large
+        feed is never held in memory.
+        """
+        parser = ET.XMLPullParser(events=("end",))
+        items: List[Articles] = []
+        entries: List[Articles] = []
+        total_items = 0
+
+        for start in range(0, len(content), FEED_CHUNK_SIZE):
+            if start:
+                # expat holds the GIL, a thread wouldn't free the loop. Yield
+                # between chunks so a large feed doesn't stall the other fetches
+                await asyncio.sleep(0)
+            parser.feed(content[start : start + FEED_CHUNK_SIZE])
+            total_items += await self._collect_items(parser, items, entries)
+        parser.close()
+        total_items += await self._collect_items(parser, items, entries)
+
+        # Entries (Atom format) are only used when no RSS items were found
+        articles_to_return = items or entries
 
         logger.info(
             "XML parsing complete",
             extra={
                 "source_name": self.source_name,
-                "total_items": len(tree.findall(".//item"))
-                + len(tree.findall(".//entry")),
+                "total_items": total_items,
                 "successful_items": len(articles_to_return),
             },
         )
         return articles_to_return
 
+    async def _collect_items(
+        self,
+        parser: ET.XMLPullParser,
+        items: List[Articles],
+        entries: List[Articles],
+    ) -> int:
+        """Turn the items and entries the parser finished into articles"""
+        seen = 0
+        for _, elem in parser.read_events():
+            if elem.tag == "item":
+                found = items
+            elif elem.tag == "entry":
+                found = entries
+            else:
+                continue
+
+            seen += 1
+            article = await self._create_article_from_xml_item(elem)
+            if article:
+                found.append(article)
+            elem.clear()
+        return seen
+
     def extract_xml_text_content(self, text: Optional[str]) -> Optional[str]:
         if text is None:
             return None
@@ -86,16 +164,17 @@ class XMLFeedParser(FeedParser):
             return self.parse_author(author_elem.text)
 
         # Dublin Core creator
-        dc_creator = item.find(
-            ".//dc:creator", {"dc": "http://purl.org/dc/elements/1.1/"}
-        )
+        dc_creator = next(item.iter(DC_CREATOR), None)
         if dc_creator is not None and dc_creator.text is not None:
             return self.parse_author(dc_creator.text)
 
         # Atom author name
-        atom_author = item.find(".//author/name")
-        if atom_author is not None and atom_author.text is not None:
-            return {"author_name": atom_author.text}
+        for author in item.iter("author"):
+            atom_author = author.find("name")
+            if atom_author is not None:
+                if atom_author.text is not None:
+                    return {"author_name": atom_author.text}
+                break
 
         return {"author_name": None}
 
@@ -112,10 +191,7 @@ class XMLFeedParser(FeedParser):
             return self.extract_xml_text_content(summary_elem.text)
 
         # Content:encoded (often used for full content)
-        content_elem = item.find(
-            ".//content:encoded",
-            {"content": "http://purl.org/rss/1.0/modules/content/"},
-        )
+        content_elem = next(item.iter(CONTENT_ENCODED), None)
         if content_elem is not None and content_elem.text is not None:
             return self.extract_xml_text_content(content_elem.text)
 
@@ -195,29 +271,9 @@ class XMLFeedParser(FeedParser):
             return None
 
     def _parse_date(self, date_str: str) -> datetime:
-        # Define date formats as a tuple for cleaner code
-        date_formats = (
-            # RFC 2822 (standard email date format)
-            lambda s: parsedate_to_datetime(s).astimezone(timezone.utc),
-            # ISO 8601 format with Z for UTC
-            lambda s: datetime.fromisoformat(s.replace("Z", "+00:00")),
-            # Common date-time formats
-            lambda s: datetime.strptime(s, "%Y-%m-%d %H:%M:%S").replace(
-                tzinfo=timezone.utc
-            ),
-            lambda s: datetime.strptime(s, "%Y-%m-%dT%H:%M:%S").replace(
-                tzinfo=timezone.utc
-            ),
-        )
-
-        # Try each format, return current time as fallback
-        for parse_func in date_formats:
-            try:
-                return parse_func(date_str)
-            except (ValueError, TypeError):
-                continue
-
-        return datetime.now(timezone.utc)
+        # Return current time as fallback, outside the cache so it stays current
+        parsed = _parse_known_date(date_str)
+        return parsed if parsed is not None else datetime.now(timezone.utc)
 
     def _find_date_element(self, item: ET.Element) -> Optional[str]:
         # Standard RSS
@@ -231,7 +287,7 @@ class XMLFeedParser(FeedParser):
             return dc_date.text
 
         # Try with full namespace path
-        dc_date_ns = item.find(".//{http://purl.org/dc/elements/1.1/}date")
+        dc_date_ns = next(item.iter(DC_DATE), None)
         if dc_date_ns is not None and dc_date_ns.text is not None:
             return dc_date_ns.text
 
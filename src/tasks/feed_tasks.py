@@ -228,6 +228,9 @@ def fetch_feed_chunk(self, feeds_chunk):
     source_stats = defaultdict(lambda: {"success": 0, "failure": 0, "articles": 0})
 
     loop = asyncio.new_event_loop()
+    # run new tasks eagerly, the many that finish without awaiting (empty hash
+    # lookups, cached categories) then never take a trip through the loop
+    loop.set_task_factory(asyncio.eager_task_factory)
     asyncio.set_event_loop(loop)
 
     try:
@@ -247,9 +250,11 @@ def fetch_feed_chunk(self, feeds_chunk):
         # fetch chunk feeds
         with PerformanceLogger(logger, f"fetch_feed_chunk_{task_id}"):
             fetch_results = loop.run_until_complete(
-                news_client.fetch_multiple_feeds(feeds_chunk)
+                # chunks come from the coordinator's feeds/sources join
+                news_client.fetch_multiple_feeds(feeds_chunk, feeds_from_db=True)
             )
             loop.run_until_complete(redis_client.close())
+            loop.run_until_complete(news_client.http_client.close())
 
         # process results
         for i, result in enumerate(fetch_results):
@@ -0,0 +1,85 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Iterable, Optional, Set, TypeVar
+
+T = TypeVar("T")
+
+
+class KeyBatcher(Generic[T]):
+    """
+    Coalesce concurrent key lookups into a single batched call
+
+    Keys requested by any caller within `window` seconds are collected and
+    resolved by one call to `batch_fn`, every caller then gets the slice it
+    asked for. Keys missing from the batch result resolve to `default`.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[Set[str]], Awaitable[Dict[str, T]]],
+        window: float = 0.005,
+        default: Optional[T] = None,
+    ):
+        self.batch_fn = batch_fn
+        self.window = window
+        self.default = default
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # the loop only keeps weak references to tasks, hold flushes until done
+        self._flushes: Set[asyncio.Task] = set()
+
+    async def load(self, keys: Iterable[str]) -> Dict[str, T]:
+        """
+        Resolve keys together with any other lookups in the current window
+
+        Args:
+            keys: Keys to look up
+
+        Returns:
+            Dict[str, T]: Result for each requested key
+
+        Raises:
+            Exception: Whatever batch_fn raised for the batch these keys were in
+        """
+        loop = asyncio.get_running_loop()
+        futures = {}
+        for key in keys:
+            future = self._pending.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._pending[key] = future
+            futures[key] = future
+
+        if not futures:
+            return {}
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._start_flush)
+
+        # Futures are shared with other callers of the same keys, shield them so
+        # cancelling this caller doesn't cancel the lookup for the others
+        return {key: await asyncio.shield(future) for key, future in futures.items()}
+
+    def _start_flush(self) -> None:
+        pending = self._pending
+        self._pending = {}
+        self._flush_handle = None
+        task = asyncio.ensure_future(self._flush(pending))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, pending: Dict[str, asyncio.Future]) -> None:
+        try:
+            results = await self.batch_fn(set(pending))
+        except BaseException as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # callers stop at their first failed key, don't warn for the rest
+                    future.exception()
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(results.get(key, self.default))
@@ -22,7 +22,8 @@ def generate_etag(data: Any, salt: str = "") -> str:
     if salt:
         content = f"{content}:{salt}"
 
-    etag_hash = hashlib.md5(content.encode()).hexdigest()
+    # Only an identifier, BLAKE2b at MD5's 16 byte size is faster than MD5
+    etag_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
     return f'"{etag_hash}"'
 
 
@@ -0,0 +1,36 @@
+from collections import deque
+from typing import Optional
+
+
+class LatencyWindow:
+    """
+    Sliding window of recent latencies for percentile based timeouts
+
+    Only the last `size` samples are kept, so the estimate follows a feed
+    whose latency drifts instead of averaging over its whole history.
+    """
+
+    def __init__(self, size: int = 128):
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Nearest-rank percentile of the window
+
+        Args:
+            q: Percentile as a fraction, e.g. 0.95
+
+        Returns:
+            Optional[float]: Latency in seconds, None while the window is empty
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))
+        return ordered[rank]
@@ -3,6 +3,7 @@ import nltk
 import hashlib
 import unicodedata
 
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 from nltk.corpus import stopwords
@@ -182,6 +183,11 @@ def clean_html_for_textual(html_content):
     return cleaned
 
 
+@lru_cache(maxsize=4096)
+def _normalize_title(title: str) -> str:
+    return re.sub(r"[^\w\s]", "", title.lower().strip())
+
+
 def calculate_title_similarity(title1: str, title2: str) -> float:
     """
     Calculate similarity between two titles
@@ -196,8 +202,33 @@ def calculate_title_similarity(title1: str, title2: str) -> float:
     if not title1 or not title2:
         return 0.0
 
-    # Normalize titles
-    t1 = re.sub(r"[^\w\s]", "", title1.lower().strip())
-    t2 = re.sub(r"[^\w\s]", "", title2.lower().strip())
+    return SequenceMatcher(
+        None, _normalize_title(title1), _normalize_title(title2)
+    ).ratio()
+
+
+def title_matcher(title: str) -> Optional[SequenceMatcher]:
+    """
+    Prepare a title to be compared against many others
+
+    SequenceMatcher indexes its second sequence, so the title is set as that
+    side once and every compared title only replaces the first one.
+
+    Args:
+        title: Title the others are compared to
+
+    Returns:
+        Optional[SequenceMatcher]: None for an empty title
+    """
+    if not title:
+        return None
+    return SequenceMatcher(None, "", _normalize_title(title))
+
+
+def matcher_similarity(matcher: Optional[SequenceMatcher], title: str) -> float:
+    """Same score as calculate_title_similarity(title, <the matcher's title>)"""
+    if matcher is None or not title:
+        return 0.0
 
-    return SequenceMatcher(None, t1, t2).ratio()
+    matcher.set_seq1(_normalize_title(title))
+    return matcher.ratio()
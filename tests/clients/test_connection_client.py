@@ -95,6 +95,32 @@ async def test_connection_creation_and_reuse(
         mock_open_connection.assert_not_called()
 
 
+@pytest.mark.asyncio
+@patch("asyncio.open_connection")
+async def test_fresh_connection_skips_idle_ones(
+    mock_open_connection, reset_connection_pool
+):
+    """Test that fresh=True opens a new connection while idle ones are pooled"""
+
+    def create_mock_connection(*args, **kwargs):
+        writer = MagicMock(spec=asyncio.StreamWriter)
+        writer.is_closing.return_value = False
+        return MagicMock(spec=asyncio.StreamReader), writer
+
+    mock_open_connection.side_effect = create_mock_connection
+
+    pool = ConnectionPool(pool_size=2, max_concurrent_requests=3)
+    host = "example.com"
+
+    async with pool.get_connection(host) as conn:
+        idle_conn_id = conn.id
+
+    async with pool.get_connection(host, fresh=True) as conn:
+        assert conn.id != idle_conn_id
+
+    assert mock_open_connection.call_count == 2
+
+
 @pytest.mark.asyncio
 @patch("asyncio.open_connection")
 async def test_connection_pool_exhaustion(mock_open_connection, reset_connection_pool):
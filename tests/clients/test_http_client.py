@@ -0,0 +1,633 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from curl_cffi.requests import Headers
+
+from src.clients.http import CircuitBreaker, CircuitState, HTTPClient, _parse_url
+from src.core.degradation import HealthService
+from src.core.exceptions import HTTPClientError
+from src.models.http import HTTPHeaders
+
+
+@pytest.fixture
+def http_client():
+    return HTTPClient(MagicMock())
+
+
+def test_from_bytes_keeps_every_set_cookie():
+    """Test that repeated Set-Cookie headers are all preserved"""
+    headers = HTTPHeaders.from_bytes(
+        b"HTTP/1.1 200 OK\r\n"
+        b"Set-Cookie: a=1; Path=/\r\n"
+        b"set-cookie: b=2\r\n"
+        b"Content-Type: text/html\r\n\r\n"
+    )
+
+    assert headers.set_cookies == ["a=1; Path=/", "b=2"]
+
+
+def test_extract_cookies_parses_all_cookies(http_client):
+    """Test that cookies are extracted from every Set-Cookie header"""
+    headers = HTTPHeaders.from_bytes(
+        b"HTTP/1.1 200 OK\r\n"
+        b"Set-Cookie: session = abc ; Path=/; HttpOnly\r\n"
+        b"Set-Cookie: consent=yes\r\n"
+        b"Set-Cookie: =ignored\r\n\r\n"
+    )
+
+    http_client._extract_cookies("www.bloomberg.com", headers)
+
+    assert http_client._cookies["www.bloomberg.com"] == {
+        "session": "abc",
+        "consent": "yes",
+    }
+
+
+def test_extract_cookies_skips_plain_domains(http_client):
+    """Test that cookies are only kept for domains configured to preserve them"""
+    headers = HTTPHeaders.from_bytes(b"HTTP/1.1 200 OK\r\nSet-Cookie: a=1\r\n\r\n")
+
+    http_client._extract_cookies("example.com", headers)
+
+    assert "example.com" not in http_client._cookies
+
+
+def test_header_template_is_prebuilt_for_special_domains(http_client):
+    """Test that special domains get a serialized header template at init"""
+    template = http_client._header_templates["www.bloomberg.com"]
+
+    assert b"Host: www.bloomberg.com\r\n" in template
+    assert b"Referer: https://www.bloomberg.com/\r\n" in template
+    assert b"Accept-Encoding: gzip\r\n" in template
+    assert b"User-Agent" not in template
+    assert template.endswith(b"\r\n")
+
+
+def test_header_template_built_lazily_for_other_hosts(http_client):
+    """Test that plain hosts get a cached template without browser headers"""
+    template = http_client._get_header_template("example.com")
+
+    assert template == b"Accept: */*\r\nAccept-Encoding: gzip\r\nHost: example.com\r\n"
+    assert http_client._get_header_template("example.com") is template
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_state_transitions():
+    """Test CLOSED -> OPEN -> HALF_OPEN -> CLOSED via the handler tables"""
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=0)
+
+    async def fail():
+        raise ValueError("boom")
+
+    async def succeed():
+        return "ok"
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await breaker.execute(fail)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.get_state()["state"] == "OPEN"
+
+    # timeout elapsed, the probe succeeds and the circuit closes
+    assert await breaker.execute(succeed) == "ok"
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_count == 0
+
+
+def test_headers_from_items_match_parsed_headers():
+    """Test that headers built from pairs equal the same parsed response"""
+    parsed = HTTPHeaders.from_bytes(
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+    )
+
+    assert (
+        HTTPHeaders.from_items(
+            "HTTP/1.1 200 OK", [("Content-Type", "application/json")]
+        )
+        == parsed
+    )
+
+
+def test_domain_config_matches_subdomains_only(http_client):
+    """Test that subdomains match a special domain but lookalikes don't"""
+    config = http_client._special_domains["tradingeconomics.com"]
+
+    assert http_client._get_domain_config("tradingeconomics.com") is config
+    assert http_client._get_domain_config("api.tradingeconomics.com") is config
+    assert http_client._get_domain_config("nottradingeconomics.com") == {}
+    assert http_client._get_domain_config("example.com") == {}
+    assert http_client._get_domain_config("tradingeconomics.com.evil.org") == {}
+    assert http_client._get_domain_config("a.b.www.bloomberg.com") is (
+        http_client._special_domains["www.bloomberg.com"]
+    )
+
+
+def test_from_bytes_lowercases_header_names():
+    """Test that header lookups work regardless of the server's casing"""
+    headers = HTTPHeaders.from_bytes(
+        b"HTTP/1.1 200 OK\r\nTransfer-encoding: chunked\r\nCONTENT-TYPE: text/xml\r\n\r\n"
+    )
+
+    assert headers.headers == {
+        "transfer-encoding": "chunked",
+        "content-type": "text/xml",
+    }
+
+
+def test_get_and_parsed_headers_keep_the_same_duplicate():
+    """Test get() agrees with the parsed dict whichever is used first"""
+    raw = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: text/html\r\n"
+        b"Content-Type: application/rss+xml\r\n\r\n"
+    )
+
+    unparsed = HTTPHeaders.from_bytes(raw)
+    assert unparsed.get("content-type") == "application/rss+xml"
+
+    parsed = HTTPHeaders.from_bytes(raw)
+    assert parsed.headers["content-type"] == "application/rss+xml"
+    assert parsed.get("content-type") == "application/rss+xml"
+
+
+def test_header_without_space_after_colon_is_parsed():
+    """Test a header written name:value is seen by get() and the parsed dict"""
+    raw = b'HTTP/1.1 200 OK\r\nETag:"x"\r\nLast-Modified:  Sat\r\n\r\n'
+
+    assert HTTPHeaders.from_bytes(raw).get("etag") == '"x"'
+    assert HTTPHeaders.from_bytes(raw).headers == {
+        "etag": '"x"',
+        "last-modified": "Sat",
+    }
+
+
+@pytest.mark.asyncio
+async def test_read_chunked_body_handles_extensions(http_client):
+    """Test that chunk extensions are ignored when parsing chunk sizes"""
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"5;name=value\r\nhello\r\n6\r\n world\r\n0\r\n\r\n")
+    reader.feed_eof()
+
+    assert await http_client._read_chunked_body(reader) == b"hello world"
+
+
+def test_cookie_hosts_are_evicted_lru():
+    """Test that per-host cookie jars are capped and evicted oldest first"""
+    client = HTTPClient(MagicMock(), max_tracked_hosts=2)
+    headers = HTTPHeaders.from_bytes(b"HTTP/1.1 200 OK\r\nSet-Cookie: a=1\r\n\r\n")
+
+    for host in (
+        "a.tradingeconomics.com",
+        "b.tradingeconomics.com",
+        "a.tradingeconomics.com",
+    ):
+        client._extract_cookies(host, headers)
+    client._extract_cookies("c.tradingeconomics.com", headers)
+
+    assert list(client._cookies) == ["a.tradingeconomics.com", "c.tradingeconomics.com"]
+
+
+def test_headers_get_scans_raw_block_lazily():
+    """Test that single header lookups don't build the headers dict"""
+    headers = HTTPHeaders.from_bytes(
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Type: text/xml\r\n"
+        b"Content-Length:  42 \r\n\r\n"
+    )
+
+    assert headers.get("content-length") == "42"
+    assert headers.get("Content-Type") == "text/xml"
+    assert headers.get("transfer-encoding") is None
+    assert headers.get("transfer-encoding", "identity") == "identity"
+    assert headers._headers is None
+
+    assert headers.headers["content-length"] == "42"
+    assert headers.get("CONTENT-LENGTH") == "42"
+
+
+def test_should_use_curl_matches_configured_endpoints(http_client):
+    """Test that curl is only used for the configured endpoints"""
+    assert http_client._should_use_curl(
+        "www.bloomberg.com", "https://www.bloomberg.com/lineup-next/api/stories"
+    )
+    assert not http_client._should_use_curl(
+        "www.bloomberg.com", "https://www.bloomberg.com/markets"
+    )
+    assert http_client._should_use_curl(
+        "tradingeconomics.com", "https://tradingeconomics.com/ws/stream.ashx?n=5"
+    )
+    assert not http_client._should_use_curl(
+        "example.com", "https://example.com/lineup-next/api"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method,response,expected_body,expected_keep_alive",
+    [
+        ("GET", b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhello", b"hello", True),
+        ("HEAD", b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n", b"", True),
+        ("GET", b"HTTP/1.1 304 Not Modified\r\n\r\n", b"", True),
+        (
+            "GET",
+            b"HTTP/1.1 200 OK\r\nConnection: close\r\n\r\nuntil eof",
+            b"until eof",
+            False,
+        ),
+        ("GET", b"HTTP/1.0 200 OK\r\nContent-Length: 2\r\n\r\nok", b"ok", False),
+    ],
+)
+async def test_read_response_framing(
+    http_client, method, response, expected_body, expected_keep_alive
+):
+    """Test body framing and connection reuse across response shapes"""
+    reader = asyncio.StreamReader()
+    reader.feed_data(response)
+    reader.feed_eof()
+
+    _, body, keep_alive = await http_client._read_response(reader, method)
+
+    assert body == expected_body
+    assert keep_alive is expected_keep_alive
+
+
+def test_header_template_cached_per_caller_headers(http_client):
+    """Test that caller headers get their own cached template"""
+    extra = {"If-None-Match": '"abc"', "User-Agent": "ignored"}
+
+    template = http_client._get_header_template("example.com", extra)
+
+    assert b'If-None-Match: "abc"\r\n' in template
+    assert b"Host: example.com\r\n" in template
+    assert b"User-Agent" not in template
+    assert http_client._get_header_template("example.com", dict(extra)) is template
+    assert http_client._get_header_template("example.com") != template
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_jitters_open_window():
+    """Test that the open window is drawn from [timeout / 2, timeout]"""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=100)
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await breaker.execute(fail)
+
+    window = breaker.open_until - breaker.last_failure_time
+    assert breaker.state == CircuitState.OPEN
+    assert 50 <= window <= 100
+    with pytest.raises(HTTPClientError):
+        await breaker.execute(fail)
+
+    # the probe fails, the timeout doubles and is jittered again
+    breaker.open_until = 0
+    with pytest.raises(ValueError):
+        await breaker.execute(fail)
+
+    window = breaker.open_until - breaker.last_failure_time
+    assert breaker.current_timeout == 200
+    assert 100 <= window <= 200
+
+
+def test_check_for_captcha_searches_raw_body(http_client):
+    """Test that captcha phrases are found in undecoded bodies"""
+    body = b"\xff\xfe<html>Are you a robot?</html>"
+
+    assert http_client._check_for_captcha("www.bloomberg.com", body)
+    assert not http_client._check_for_captcha("www.bloomberg.com", b"<html></html>")
+    assert not http_client._check_for_captcha("example.com", body)
+
+
+@pytest.mark.asyncio
+async def test_read_bodies_handle_trailers_and_short_reads(http_client):
+    """Test chunked trailers are skipped and truncated bodies raise"""
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"3\r\nabc\r\n0\r\nExpires: never\r\n\r\nnext")
+    reader.feed_eof()
+
+    assert await http_client._read_chunked_body(reader) == b"abc"
+    assert await reader.read() == b"next"
+
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"short")
+    reader.feed_eof()
+
+    with pytest.raises(asyncio.IncompleteReadError):
+        await http_client._read_body(reader, 10)
+
+
+def test_extract_cookies_caches_cookie_header(http_client):
+    """Test that preserved cookies are serialized once for the next request"""
+    http_client._extract_cookies(
+        "www.bloomberg.com",
+        HTTPHeaders.from_bytes(
+            b"HTTP/1.1 200 OK\r\nSet-Cookie: a=1; Path=/\r\nSet-Cookie: b=2\r\n\r\n"
+        ),
+    )
+    header = http_client._cookie_headers["www.bloomberg.com"]
+
+    http_client._extract_cookies(
+        "www.bloomberg.com", HTTPHeaders.from_bytes(b"HTTP/1.1 200 OK\r\n\r\n")
+    )
+
+    assert header == b"Cookie: a=1; b=2\r\n"
+    assert http_client._cookie_headers["www.bloomberg.com"] is header
+
+
+@pytest.mark.asyncio
+async def test_fetch_with_curl_reports_real_status_and_headers(http_client):
+    """Test that curl responses keep their status and drop framing headers"""
+    http_client._curl_session = MagicMock()
+    http_client._curl_session.get = AsyncMock(
+        return_value=SimpleNamespace(
+            status_code=403,
+            reason="Forbidden",
+            headers=Headers(
+                [
+                    ("Content-Type", "text/html"),
+                    ("Content-Encoding", "gzip"),
+                    ("Set-Cookie", "a=1"),
+                    ("Set-Cookie", "b=2"),
+                ]
+            ),
+            content=b"denied",
+        )
+    )
+
+    headers, body = await http_client._fetch_with_curl(
+        "https://www.bloomberg.com/lineup-next/api", "www.bloomberg.com"
+    )
+
+    assert headers.status_line == "HTTP/1.1 403 Forbidden"
+    assert headers.headers == {"content-type": "text/html", "set-cookie": "b=2"}
+    assert headers.set_cookies == ["a=1", "b=2"]
+    assert body == b"denied"
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_forwards_args_and_uses_fallback():
+    """Test positional args reach func and the fallback covers failures"""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=100)
+
+    async def echo(value):
+        if value == "bad":
+            raise ValueError("boom")
+        return value
+
+    async def fallback():
+        return "fallback"
+
+    assert await breaker.execute(echo, "ok", cache_key="key") == "ok"
+    assert await breaker.execute(echo, "bad", fallback=fallback) == "fallback"
+    assert breaker.state == CircuitState.OPEN
+
+    # open: cached data first, then the fallback, then an error
+    assert await breaker.execute(echo, "ok", cache_key="key") == "ok"
+    assert await breaker.execute(echo, "ok", fallback=fallback) == "fallback"
+    with pytest.raises(HTTPClientError):
+        await breaker.execute(echo, "ok")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_sends_followers_to_their_fallback():
+    """Test cancelling the coalesced call's leader doesn't cancel its followers"""
+    breaker = CircuitBreaker("test", failure_threshold=5, reset_timeout=100)
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+        return "result"
+
+    async def fallback():
+        return "fallback"
+
+    leader = asyncio.create_task(breaker.execute(slow, cache_key="key"))
+    await started.wait()
+    follower = asyncio.create_task(
+        breaker.execute(slow, cache_key="key", fallback=fallback)
+    )
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    assert await follower == "fallback"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert breaker._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_conditional_requests_are_not_coalesced_with_plain_ones():
+    """Test a 304 for one caller's validators isn't handed to a plain GET"""
+    client = HTTPClient(MagicMock())
+    breaker = CircuitBreaker("test", failure_threshold=5, reset_timeout=100)
+    client._get_circuit_breaker = lambda host: breaker
+    client._should_use_curl = lambda host, url: False
+
+    async def do_request(method, path, host, url, headers, conditional_headers):
+        await asyncio.sleep(0.01)
+        if conditional_headers:
+            return HTTPHeaders("HTTP/1.1 304 Not Modified", {}, []), b""
+        return HTTPHeaders("HTTP/1.1 200 OK", {}, []), b"<rss/>"
+
+    client._do_request = do_request
+
+    conditional, plain = await asyncio.gather(
+        client.request(
+            "GET",
+            "https://example.com/feed",
+            conditional_headers={"If-None-Match": '"abc"'},
+        ),
+        client.request("GET", "https://example.com/feed"),
+    )
+
+    assert conditional[0].status_code == 304
+    assert plain == (HTTPHeaders("HTTP/1.1 200 OK", {}, []), b"<rss/>")
+
+
+@pytest.mark.asyncio
+async def test_requests_differing_in_method_or_headers_are_not_coalesced():
+    """Test only requests with the same method and headers share a response"""
+    client = HTTPClient(MagicMock())
+    breaker = CircuitBreaker("test", failure_threshold=5, reset_timeout=100)
+    client._get_circuit_breaker = lambda host: breaker
+    client._should_use_curl = lambda host, url: False
+    sent = []
+
+    async def do_request(method, path, host, url, headers, conditional_headers):
+        sent.append((method, headers))
+        await asyncio.sleep(0.01)
+        return HTTPHeaders("HTTP/1.1 200 OK", {}, []), f"{method} {headers}".encode()
+
+    client._do_request = do_request
+    url = "https://example.com/feed"
+
+    results = await asyncio.gather(
+        client.request("GET", url),
+        client.request("HEAD", url),
+        client.request("GET", url, request_headers={"Accept": "application/json"}),
+        client.request("GET", url),
+    )
+
+    assert len(sent) == 3
+    assert [body for _, body in results] == [
+        b"GET None",
+        b"HEAD None",
+        b"GET {'Accept': 'application/json'}",
+        b"GET None",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_do_request_writes_crlf_framed_request():
+    """Test the request is written as one CRLF framed buffer"""
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+    conn = SimpleNamespace(reader=reader, writer=MagicMock())
+    conn.writer.transport.get_write_buffer_size.return_value = 0
+
+    @asynccontextmanager
+    async def get_connection(host, fresh=False):
+        yield conn
+
+    pool = MagicMock()
+    pool.get_connection = get_connection
+    client = HTTPClient(pool)
+
+    headers, body = await client._do_request(
+        "GET", "/feed?x=1", "example.com", "https://example.com/feed?x=1", None
+    )
+
+    request = conn.writer.write.call_args.args[0]
+    assert request.startswith(b"GET /feed?x=1 HTTP/1.1\r\nUser-Agent: ")
+    assert request.endswith(b"Host: example.com\r\n\r\n")
+    assert b"\n" not in request.replace(b"\r\n", b"")
+    assert conn.writer.write.call_count == 1
+    assert body == b"ok"
+
+
+@pytest.mark.asyncio
+async def test_conditional_headers_are_sent_but_not_templated():
+    """Test per-request validators reach the wire without growing the templates"""
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"HTTP/1.1 304 Not Modified\r\n\r\n")
+    conn = SimpleNamespace(reader=reader, writer=MagicMock())
+    conn.writer.transport.get_write_buffer_size.return_value = 0
+
+    @asynccontextmanager
+    async def get_connection(host, fresh=False):
+        yield conn
+
+    pool = MagicMock()
+    pool.get_connection = get_connection
+    client = HTTPClient(pool)
+
+    headers, body = await client.request(
+        "GET",
+        "https://example.com/feed",
+        conditional_headers={"If-None-Match": '"abc"'},
+    )
+
+    request = conn.writer.write.call_args.args[0]
+    assert request.endswith(b'If-None-Match: "abc"\r\n\r\n')
+    assert [key for key in client._header_templates if "example.com" in key] == [
+        "example.com"
+    ]
+    assert headers.status_code == 304
+    assert body == b""
+
+
+@pytest.mark.asyncio
+async def test_request_falls_back_through_health_service_breaker():
+    """Test the fallback works with the HealthService circuit breakers"""
+    health_service = HealthService()
+    client = HTTPClient(MagicMock(), health_service=health_service)
+    client._do_request = AsyncMock(side_effect=HTTPClientError(detail="down"))
+    client._do_fallback = AsyncMock(return_value="fallback")
+
+    result = await client.request("GET", "https://www.bloomberg.com/markets")
+
+    assert result == "fallback"
+    client._do_fallback.assert_awaited_once_with(
+        "www.bloomberg.com", "https://www.bloomberg.com/markets"
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_concurrency_is_bounded_per_domain(http_client):
+    """Test that configured domains never exceed max_concurrency in flight"""
+    in_flight = 0
+    peak = 0
+
+    async def dispatch(*args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    http_client._dispatch = dispatch
+
+    await asyncio.gather(
+        *(http_client.request("GET", "https://www.bloomberg.com/") for _ in range(20))
+    )
+
+    assert peak == 8
+    assert http_client._get_host_semaphore("example.com") is None
+
+
+def test_parse_url_splits_host_and_path():
+    """Test urls are split into host and request target"""
+    assert _parse_url("https://example.com") == ("example.com", "/")
+    assert _parse_url("https://example.com/rss?a=1&b=2") == (
+        "example.com",
+        "/rss?a=1&b=2",
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_retries_idempotent_requests_once(monkeypatch):
+    """Test a dropped keep-alive connection is retried once for GET only"""
+    monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+    responses = [b"", b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"]
+    connections = []
+
+    @asynccontextmanager
+    async def get_connection(host, fresh=False):
+        reader = asyncio.StreamReader()
+        reader.feed_data(responses[len(connections) % 2])
+        reader.feed_eof()
+        conn = SimpleNamespace(reader=reader, writer=MagicMock(), fresh=fresh)
+        conn.writer.transport.get_write_buffer_size.return_value = 0
+        connections.append(conn)
+        yield conn
+
+    pool = MagicMock()
+    pool.get_connection = get_connection
+    client = HTTPClient(pool)
+
+    _, body = await client._send("GET", "example.com", b"GET / HTTP/1.1\r\n\r\n")
+
+    assert body == b"ok"
+    assert len(connections) == 2
+    connections[0].writer.close.assert_called_once()
+    # The retry opens a new connection instead of taking the next idle one
+    assert [conn.fresh for conn in connections] == [False, True]
+
+    connections.clear()
+    with pytest.raises(asyncio.IncompleteReadError):
+        await client._send("POST", "example.com", b"POST / HTTP/1.1\r\n\r\n")
+    assert len(connections) == 1
+
+
+def test_headers_parse_status_code_once():
+    """Test the status code is exposed as an int and attributes are slotted"""
+    headers = HTTPHeaders.from_bytes(b"HTTP/1.1 404 Not Found\r\n\r\n")
+
+    assert headers.status_code == 404
+    assert not hasattr(headers, "__dict__")
@@ -2,25 +2,104 @@ import pytest
 import asyncio
 from unittest.mock import MagicMock, patch, AsyncMock
 import datetime
+import zlib
 
-from src.clients.news import NewsClient
+from sqlalchemy import event, text
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlmodel import SQLModel, Session, create_engine, select
+
+import src.clients.news as news
+from src.clients.news import FeedRow, NewsClient
+from src.clients.redis import RedisClient
+from src.core.config import settings
 from src.core.exceptions import RSSFeedError
-from src.models.db_models import Articles, Categories
-from tests.factories import (
-    SourceFactory,
-    CategoryFactory,
-    ArticleFactory,
-    set_factory_session,
-)
+from src.db.database import enable_sqlite_foreign_keys
+from src.models.db_models import Articles, Feeds, Sources
+from src.models.http import HTTPHeaders
+from src.utils.latency import LatencyWindow
+
+SOURCE = "testsrc"
+FEED_URL = "https://example.com/feed.xml"
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """File backed sqlite, so a second connection sees only committed rows"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'news.db'}", connect_args={"check_same_thread": False}
+    )
+    event.listen(engine, "connect", enable_sqlite_foreign_keys)
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine) as session:
+        session.add(
+            Sources(
+                name=SOURCE,
+                display_name="Test Source",
+                feed_symbol="tst",
+                base_url="example.com",
+                fetch_interval=3600,
+            )
+        )
+        for name in ("a", "b", "c"):
+            session.add(
+                Feeds(
+                    source_name=SOURCE,
+                    name=name,
+                    feed_url=f"https://example.com/{name}.xml",
+                    display_name=name.upper(),
+                )
+            )
+        session.commit()
+        yield session
+
+
+@pytest.fixture
+def committed_count(engine):
+    """Count the articles another connection can see"""
+
+    def count() -> int:
+        with engine.connect() as connection:
+            return connection.execute(text("SELECT count(*) FROM articles")).scalar()
+
+    return count
+
+
+@pytest.fixture(autouse=True)
+def reset_module_state():
+    news._seen_signatures.clear()
+    news._feed_latencies.clear()
+    yield
+    news._seen_signatures.clear()
+    news._feed_latencies.clear()
+
+
+def make_articles(*titles: str) -> list[Articles]:
+    now = datetime.datetime(2025, 3, 1, 13, 0, 0)
+    return [
+        Articles(
+            title=title,
+            signature=title,
+            pub_date=now,
+            pub_date_raw="Sat, 01 Mar 2025 13:00:00 +0000",
+            original_url=f"https://example.com/{title}",
+            source_name=SOURCE,
+        )
+        for title in titles
+    ]
 
 
 @pytest.fixture
 def mock_http_response():
-    headers = MagicMock()
-    headers.headers = {
-        "Content-Type": "application/xml",
-        "Content-Encoding": "",
-    }
+    headers = HTTPHeaders(
+        status_line="HTTP/1.1 200 OK",
+        headers={"content-type": "application/xml", "content-encoding": ""},
+    )
     return (
         headers,
         b"<rss><channel><item><title>Test Article</title></item></channel></rss>",
@@ -30,182 +109,150 @@ def mock_http_response():
 @pytest.fixture
 def mock_parser():
     parser = AsyncMock()
-    parser.parse_content.return_value = [
-        Articles(
-            title="Test Article 1",
-            pub_date=datetime.datetime.now(),
-            pub_date_raw="Wed, 01 Mar 2025 13:00:00 +0000",
-            content_hash="hash1",
-            original_url="https://example.com/test-article-1",
-            source_id=1,
-        ),
-        Articles(
-            title="Test Article 2",
-            pub_date=datetime.datetime.now(),
-            pub_date_raw="Wed, 01 Mar 2025 13:00:00 +0000",
-            content_hash="hash2",
-            original_url="https://example.com/test-article-2",
-            source_id=2,
-        ),
-    ]
+    parser.parse_content.return_value = make_articles(
+        "Test Article One", "Another Story Entirely"
+    )
     return parser
 
 
-@pytest.fixture(autouse=True)
-def setup_factories(db_session):
-    set_factory_session(db_session)
+@pytest.fixture
+def mock_redis_client():
+    redis = MagicMock(spec=RedisClient)
+    redis.pipeline_check_hashes.return_value = {}
+    redis.pipeline_add_hashes.return_value = None
+    redis.get_feed_validators.return_value = {}
+    return redis
 
 
-class TestNewsClient:
-    @pytest.fixture
-    def news_client(self, db_session, mock_redis_client):
-        yield NewsClient(db_session, mock_redis_client)
-        db_session.rollback()
+@pytest.fixture
+def news_client(session, mock_redis_client):
+    return NewsClient(session, mock_redis_client)
 
+
+class TestNewsClient:
     @pytest.mark.asyncio
     async def test_fetch_headlines_success(
-        self, news_client, db_session, mock_http_response, mock_parser
+        self, news_client, session, mock_http_response, mock_parser
     ):
-        source = SourceFactory()
-        category = CategoryFactory(source_id=source.id)
-
-        db_session.commit()
-
         news_client.http_client.request = AsyncMock(return_value=mock_http_response)
         news_client._get_parser = MagicMock(return_value=mock_parser)
-        news_client.redis.pipeline_check_hashes = AsyncMock(return_value={})
-        news_client.redis.pipeline_add_hashes = AsyncMock()
 
-        result = await news_client.fetch_headlines(
-            source.id, category.id, "https://example.com/feed.xml"
-        )
+        result = await news_client.fetch_headlines(SOURCE, "a", FEED_URL)
+        await news_client._flush_hash_writes()
 
-        assert result == (2, 0)
+        assert result == (2, None)
 
-        saved_articles = db_session.query(Articles).all()
+        saved_articles = session.exec(select(Articles)).all()
         assert len(saved_articles) == 2
 
         news_client.redis.pipeline_add_hashes.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_fetch_headlines_with_existing_articles(
-        self, news_client, db_session, mock_http_response, mock_parser
+        self, news_client, session, mock_http_response, mock_parser
     ):
-        source = SourceFactory()
-        category = CategoryFactory(source_id=source.id)
-
-        existing_article = ArticleFactory(
-            source_id=source.id,
-            content_hash="hash1",
-        )
+        session.add(make_articles("Test Article One")[0])
+        session.commit()
 
         news_client.http_client.request = AsyncMock(return_value=mock_http_response)
         news_client._get_parser = MagicMock(return_value=mock_parser)
+        news_client.redis.pipeline_check_hashes.return_value = {
+            "Test Article One": True
+        }
 
-        news_client.redis.pipeline_check_hashes = AsyncMock(
-            return_value={"hash1": True, "hash2": False}
-        )
-        news_client.redis.pipeline_add_hashes = AsyncMock()
-
-        result = await news_client.fetch_headlines(
-            source.id, category.id, "https://example.com/feed.xml"
-        )
-        assert result == (1, 0)
+        result = await news_client.fetch_headlines(SOURCE, "a", FEED_URL)
+        assert result == (1, None)
 
-        saved_articles = db_session.query(Articles).all()
+        saved_articles = session.exec(select(Articles)).all()
         assert len(saved_articles) == 2
 
     @pytest.mark.asyncio
-    async def test_fetch_headlines_timeout(self, news_client, db_session, mock_logger):
-        source = SourceFactory()
-        category = CategoryFactory(source_id=source.id)
-        db_session.commit()
-
+    async def test_fetch_headlines_timeout(self, news_client):
         news_client.http_client.request = AsyncMock(side_effect=asyncio.TimeoutError())
 
-        with patch("src.clients.news.logger", mock_logger):
-            result = await news_client.fetch_headlines(
-                source.id, category.id, "https://example.com/feed.xml"
-            )
-
-            assert result == (0, 0)
+        with patch("src.clients.news.logger") as mock_logger:
+            count, error = await news_client.fetch_headlines(SOURCE, "a", FEED_URL)
 
+            assert count == 0
+            assert isinstance(error, RSSFeedError)
             assert mock_logger.error.called
 
     @pytest.mark.asyncio
     async def test_fetch_multiple_feeds(self, news_client):
-        source1 = SourceFactory()
-        source2 = SourceFactory()
-        category1 = CategoryFactory(source_id=source1.id)
-        category2 = CategoryFactory(source_id=source2.id)
-
         feeds = [
-            (source1.id, category1.id, "https://example.com/feed1.xml"),
-            (source2.id, category2.id, "https://example.com/feed2.xml"),
+            (SOURCE, "a", "https://example.com/a.xml"),
+            (SOURCE, "b", "https://example.com/b.xml"),
         ]
 
         news_client.fetch_headlines = AsyncMock()
-        news_client.fetch_headlines.side_effect = [(3, 0), (2, 0)]
+        news_client.fetch_headlines.side_effect = [(3, None), (2, None)]
 
         results = await news_client.fetch_multiple_feeds(feeds)
 
-        assert results == [(3, 0), (2, 0)]
+        assert results == [(3, None), (2, None)]
 
         assert news_client.fetch_headlines.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_fetch_multiple_feeds_with_errors(self, news_client, db_session):
-        source1 = SourceFactory()
-        source2 = SourceFactory()
-        category1 = CategoryFactory(source_id=source1.id)
-        category2 = CategoryFactory(source_id=source2.id)
-        db_session.commit()
-
+    async def test_fetch_multiple_feeds_with_errors(self, news_client):
         feeds = [
-            (source1.id, category1.id, "https://example.com/feed1.xml"),
-            (source2.id, category2.id, "https://example.com/feed2.xml"),
+            (SOURCE, "a", "https://example.com/a.xml"),
+            (SOURCE, "b", "https://example.com/b.xml"),
         ]
+        error = RSSFeedError("Failed to fetch feed")
 
-        async def mock_fetch_headlines(source_id, category_id, feed_url):
-            if source_id == source1.id:
-                return (3, 0)
-            else:
-                raise RSSFeedError("Failed to fetch feed")
+        async def mock_fetch_headlines(source_name, feed_name, feed_url):
+            if feed_name == "a":
+                return (3, None)
+            raise error
 
         with patch.object(
             news_client, "fetch_headlines", side_effect=mock_fetch_headlines
         ):
             results = await news_client.fetch_multiple_feeds(feeds)
-            assert results[0] == (3, 0)
-            assert results[1] == (0, 0)
+            assert results[0] == (3, None)
+            assert results[1] == (0, error)
 
     def test_get_parser_xml(self, news_client):
-        parser = news_client._get_parser("application/xml", 1)
+        parser = news_client._get_parser("application/xml", SOURCE)
         assert parser.__class__.__name__ == "XMLFeedParser"
 
     def test_get_parser_json(self, news_client):
-        parser = news_client._get_parser("application/json", 1)
+        parser = news_client._get_parser("application/json", SOURCE)
         assert parser.__class__.__name__ == "JSONFeedParser"
 
-    def test_get_parser_unknown(self, news_client, mock_logger):
-        with patch("src.clients.news.logger", mock_logger):
-            parser = news_client._get_parser("text/plain", 1)
+    def test_get_parser_unknown(self, news_client):
+        with patch("src.clients.news.logger") as mock_logger:
+            parser = news_client._get_parser("text/plain", SOURCE)
             assert parser.__class__.__name__ == "XMLFeedParser"
 
             mock_logger.warning.assert_called_once_with(
-                "Unknown content type: text/plain, defaulting to XML parser. Source: 1"
+                "Unknown content type. Trying XML parser",
+                extra={"content_type": "text/plain", "source_name": SOURCE},
             )
 
     def test_get_parser_caching(self, news_client):
-        parser1 = news_client._get_parser("application/xml", 1)
-        parser2 = news_client._get_parser("application/xml", 1)
+        parser1 = news_client._get_parser("application/xml", SOURCE)
+        parser2 = news_client._get_parser("application/xml", SOURCE)
 
         assert parser1 is parser2
 
-        parser3 = news_client._get_parser("application/json", 1)
+        parser3 = news_client._get_parser("application/json", SOURCE)
 
         assert parser1 is not parser3
 
+    def test_deduplicate_by_signature_with_naive_and_aware_dates(self, news_client):
+        naive, aware, other = make_articles("dup", "dup", "other")
+        naive.pub_date = datetime.datetime(2025, 3, 1, 12, 0, 0)
+        aware.pub_date = datetime.datetime(2025, 3, 1, 11, 0, tzinfo=datetime.UTC)
+        other.pub_date = datetime.datetime(2025, 3, 1, 13, 0, tzinfo=datetime.UTC)
+
+        unique = news_client._deduplicate_by_signature([naive, other, aware])
+
+        # The earliest article per signature wins, naive dates count as UTC
+        assert len(unique) == 2
+        assert aware in unique and other in unique
+
     @pytest.mark.asyncio
     async def test_process_feed_gzip(self, news_client, mock_parser):
         import gzip
@@ -216,18 +263,448 @@ class TestNewsClient:
 
         gzipped_content = gzip.compress(content)
 
-        headers = MagicMock()
-        headers.headers = {
-            "Content-Type": "application/xml",
-            "Content-Encoding": "gzip",
-        }
+        headers = HTTPHeaders(
+            status_line="HTTP/1.1 200 OK",
+            headers={"content-type": "application/xml", "content-encoding": "gzip"},
+        )
 
         response = (headers, gzipped_content)
 
         news_client._get_parser = MagicMock(return_value=mock_parser)
 
-        articles = await news_client._process_feed(response, 1)
+        articles = await news_client._process_feed(response, SOURCE)
 
         mock_parser.parse_content.assert_called_once()
 
         assert len(articles) == 2
+
+    @pytest.mark.asyncio
+    async def test_process_feed_deflate(self, news_client, mock_parser):
+        content = (
+            b"<rss><channel><item><title>Test Article</title></item></channel></rss>"
+        )
+        headers = HTTPHeaders(
+            status_line="HTTP/1.1 200 OK",
+            headers={"content-type": "application/xml", "content-encoding": "deflate"},
+        )
+        news_client._get_parser = MagicMock(return_value=mock_parser)
+
+        articles = await news_client._process_feed(
+            (headers, zlib.compress(content)), SOURCE
+        )
+
+        mock_parser.parse_content.assert_called_once_with(content)
+        assert len(articles) == 2
+
+    @pytest.mark.asyncio
+    async def test_process_feed_raw_deflate(self, news_client, mock_parser):
+        content = (
+            b"<rss><channel><item><title>Test Article</title></item></channel></rss>"
+        )
+        # Some servers send a bare deflate stream without the zlib wrapper
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        raw_deflate = compressor.compress(content) + compressor.flush()
+        headers = HTTPHeaders(
+            status_line="HTTP/1.1 200 OK",
+            headers={"content-type": "application/xml", "content-encoding": "deflate"},
+        )
+        news_client._get_parser = MagicMock(return_value=mock_parser)
+
+        articles = await news_client._process_feed((headers, raw_deflate), SOURCE)
+
+        mock_parser.parse_content.assert_called_once_with(content)
+        assert len(articles) == 2
+
+
+def latency_window(*samples: float) -> LatencyWindow:
+    window = LatencyWindow()
+    for seconds in samples:
+        window.add(seconds)
+    return window
+
+
+class TestFeedTimeout:
+    def test_configured_or_default_timeout_until_enough_samples(self, monkeypatch):
+        monkeypatch.setitem(news._FEED_TIMEOUTS, (SOURCE, "a"), 7.5)
+        window = latency_window(*[0.1] * (news._TIMEOUT_MIN_SAMPLES - 1))
+
+        assert NewsClient._feed_timeout(window, SOURCE, "a") == 7.5
+        assert NewsClient._feed_timeout(window, SOURCE, "b") == settings.REQUEST_TIMEOUT
+
+    @pytest.mark.parametrize(
+        "latency, expected",
+        [(2.0, 3.0), (0.1, news._TIMEOUT_MIN), (100.0, news._TIMEOUT_MAX)],
+    )
+    def test_timeout_is_clamped_1_5x_p95(self, latency, expected):
+        window = latency_window(*[latency] * news._TIMEOUT_MIN_SAMPLES)
+
+        assert NewsClient._feed_timeout(window, SOURCE, "a") == pytest.approx(expected)
+
+    @pytest.mark.asyncio
+    async def test_timeouts_are_fed_back_as_samples(self, news_client, monkeypatch):
+        monkeypatch.setitem(news._FEED_TIMEOUTS, (SOURCE, "a"), 0.01)
+
+        async def hang(*args):
+            await asyncio.Event().wait()
+
+        news_client._fetch_feed = hang
+
+        count, error = await news_client.fetch_headlines(SOURCE, "a", FEED_URL)
+
+        assert count == 0
+        assert isinstance(error, asyncio.TimeoutError)
+        window = news._feed_latencies[(SOURCE, "a")]
+        assert len(window) == 1
+        assert window.percentile(0.95) == 0.01
+
+
+class TestFeedBatchTransaction:
+    @pytest.fixture
+    def persisting_client(self, news_client):
+        """Client whose feeds save fixed articles straight through _persist_articles"""
+        feed_articles = {}
+
+        async def fetch_headlines(source_name, feed_name, url):
+            articles = feed_articles[feed_name]
+            if isinstance(articles, BaseException):
+                raise articles
+            if isinstance(articles, asyncio.Event):
+                # Signal the feed is running, then hang until cancelled
+                articles.set()
+                await asyncio.Event().wait()
+            saved = await news_client._persist_articles(
+                articles, FeedRow(source_name, feed_name, feed_name.upper())
+            )
+            headers = HTTPHeaders("HTTP/1.1 200 OK", {"etag": f'"{feed_name}"'})
+            await news_client._remember_validators(url, headers, {})
+            return saved, None
+
+        news_client.fetch_headlines = fetch_headlines
+        news_client.feed_articles = feed_articles
+        return news_client
+
+    @pytest.mark.asyncio
+    async def test_batch_commits_once_and_failed_feed_rolls_back_alone(
+        self, persisting_client, committed_count
+    ):
+        client = persisting_client
+        await client.set_max_concurrency(1)
+        seen_during_batch = []
+
+        real_persist = client._persist_articles
+
+        async def persist_and_observe(articles, feed):
+            saved = await real_persist(articles, feed)
+            seen_during_batch.append(
+                (
+                    committed_count(),
+                    set(news._seen_signatures),
+                    client.redis.pipeline_add_hashes.call_count,
+                )
+            )
+            return saved
+
+        client._persist_articles = persist_and_observe
+        client.feed_articles.update(
+            a=make_articles("alpha one", "alpha two"),
+            # Same signature as feed a, the unique index rejects the insert
+            b=make_articles("bravo one", "alpha one"),
+            c=make_articles("charlie one"),
+        )
+
+        results = await client.fetch_multiple_feeds(
+            [(SOURCE, name, f"https://example.com/{name}.xml") for name in "abc"]
+        )
+
+        assert results[0] == (2, None) and results[2] == (1, None)
+        assert results[1][0] == 0
+        assert isinstance(results[1][1], IntegrityError)
+        # Nothing reached other connections, the LRU or Redis before the commit
+        assert seen_during_batch == [(0, set(), 0)] * 2
+
+        assert committed_count() == 3
+        assert set(news._seen_signatures) == {"alpha one", "alpha two", "charlie one"}
+        published = client.redis.pipeline_add_hashes.call_args.args[0]
+        assert set(published) == {"alpha one", "alpha two", "charlie one"}
+        assert client._batch_hashes is None
+        # Validators only for the feeds whose articles were committed
+        stored = client.redis.set_feed_validators.await_args_list
+        assert sorted(call.args for call in stored) == [
+            ("https://example.com/a.xml", {"etag": '"a"'}),
+            ("https://example.com/c.xml", {"etag": '"c"'}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_begin_batch_defers_sqlite_commit_past_savepoints(
+        self, news_client, committed_count
+    ):
+        await news_client._run_db(news_client._begin_batch)
+        news_client._batch_hashes = []
+
+        feed = FeedRow(SOURCE, "a", "A")
+        assert await news_client._persist_articles(make_articles("one"), feed) == 1
+        # Releasing the first savepoint must not commit it
+        assert committed_count() == 0
+
+        await news_client._commit_batch()
+        assert committed_count() == 1
+
+        # Outside a batch every save commits on its own again
+        assert await news_client._persist_articles(make_articles("two"), feed) == 1
+        assert committed_count() == 2
+
+    @pytest.mark.asyncio
+    async def test_aborted_batch_keeps_finished_feeds(
+        self, persisting_client, committed_count
+    ):
+        client = persisting_client
+        await client.set_max_concurrency(1)
+        client.feed_articles.update(a=make_articles("alpha one"), b=MemoryError())
+
+        with pytest.raises(MemoryError):
+            await client.fetch_multiple_feeds(
+                [(SOURCE, name, f"https://example.com/{name}.xml") for name in "ab"]
+            )
+
+        assert committed_count() == 1
+        assert client._batch_hashes is None
+        # The committed feed's hashes were written and the writer stopped
+        client.redis.pipeline_add_hashes.assert_called_once()
+        assert client._hash_writer is None
+        client.redis.set_feed_validators.assert_awaited_once_with(
+            "https://example.com/a.xml", {"etag": '"a"'}
+        )
+
+    @pytest.mark.asyncio
+    async def test_links_to_a_removed_feed_are_rejected(
+        self, persisting_client, committed_count
+    ):
+        client = persisting_client
+        client.feed_articles.update(
+            a=make_articles("alpha one"), removed=make_articles("removed one")
+        )
+
+        results = await client.fetch_multiple_feeds(
+            [
+                (SOURCE, name, f"https://example.com/{name}.xml")
+                for name in ("a", "removed")
+            ],
+            feeds_from_db=True,
+        )
+
+        # The feed went away after the coordinator listed it, only its save fails
+        assert results[0] == (1, None)
+        assert isinstance(results[1][1], IntegrityError)
+        assert committed_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_commit_stores_no_validators(
+        self, persisting_client, committed_count
+    ):
+        client = persisting_client
+        client.feed_articles.update(a=make_articles("alpha one"))
+        client.session.commit = MagicMock(side_effect=OperationalError("", {}, None))
+
+        with pytest.raises(OperationalError):
+            await client.fetch_multiple_feeds(
+                [(SOURCE, "a", "https://example.com/a.xml")]
+            )
+
+        assert committed_count() == 0
+        assert client._batch_validators == []
+        client.redis.set_feed_validators.assert_not_called()
+        client.redis.pipeline_add_hashes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_rolls_back(
+        self, persisting_client, session, committed_count
+    ):
+        client = persisting_client
+        await client.set_max_concurrency(1)
+        blocked = asyncio.Event()
+        client.feed_articles.update(a=make_articles("alpha one"), b=blocked)
+        news._seen_signatures["stale"] = True
+
+        batch = asyncio.create_task(
+            client.fetch_multiple_feeds(
+                [(SOURCE, name, f"https://example.com/{name}.xml") for name in "ab"]
+            )
+        )
+        await blocked.wait()
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+
+        assert committed_count() == 0
+        assert client._batch_hashes is None
+        assert not news._seen_signatures
+        assert session.exec(select(Articles)).all() == []
+        client.redis.pipeline_add_hashes.assert_not_called()
+        # Feed a finished before the cancel, its validators went with the batch
+        client.redis.set_feed_validators.assert_not_called()
+
+        # The client isn't left in batch mode, a later save commits by itself
+        feed = FeedRow(SOURCE, "a", "A")
+        assert await client._persist_articles(make_articles("later"), feed) == 1
+        assert committed_count() == 1
+
+
+class TestConditionalGet:
+    VALIDATORS = {"etag": '"v1"', "last-modified": "Sat, 01 Mar 2025 13:00:00 GMT"}
+
+    @pytest.mark.asyncio
+    async def test_validators_are_stored_from_200(self, news_client, mock_parser):
+        headers = HTTPHeaders(
+            status_line="HTTP/1.1 200 OK",
+            headers={"content-type": "application/xml", **self.VALIDATORS},
+        )
+        news_client.http_client.request = AsyncMock(return_value=(headers, b"<rss/>"))
+        news_client._get_parser = MagicMock(return_value=mock_parser)
+
+        assert await news_client.fetch_headlines(SOURCE, "a", FEED_URL) == (2, None)
+
+        news_client.redis.set_feed_validators.assert_awaited_once_with(
+            FEED_URL, self.VALIDATORS
+        )
+
+    @pytest.mark.asyncio
+    async def test_next_poll_sends_stored_validators(self, news_client):
+        news_client.redis.get_feed_validators.return_value = self.VALIDATORS
+        not_modified = HTTPHeaders("HTTP/1.1 304 Not Modified", {}, [])
+        news_client.http_client.request = AsyncMock(return_value=(not_modified, b""))
+
+        await news_client.fetch_headlines(SOURCE, "a", FEED_URL)
+
+        news_client.redis.get_feed_validators.assert_awaited_once_with(FEED_URL)
+        sent = news_client.http_client.request.call_args.kwargs["conditional_headers"]
+        assert sent == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Sat, 01 Mar 2025 13:00:00 GMT",
+        }
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_no_articles_without_parsing(
+        self, news_client, session
+    ):
+        news_client.redis.get_feed_validators.return_value = self.VALIDATORS
+        not_modified = HTTPHeaders("HTTP/1.1 304 Not Modified", {}, [])
+        news_client.http_client.request = AsyncMock(return_value=(not_modified, b""))
+        news_client._get_parser = MagicMock()
+
+        assert await news_client.fetch_headlines(SOURCE, "a", FEED_URL) == (0, None)
+
+        news_client._get_parser.assert_not_called()
+        news_client.redis.set_feed_validators.assert_not_called()
+        assert session.exec(select(Articles)).all() == []
+
+    @pytest.mark.asyncio
+    async def test_validators_are_not_stored_when_the_save_fails(
+        self, news_client, session, mock_parser
+    ):
+        headers = HTTPHeaders(
+            status_line="HTTP/1.1 200 OK",
+            headers={"content-type": "application/xml", **self.VALIDATORS},
+        )
+        news_client.http_client.request = AsyncMock(return_value=(headers, b"<rss/>"))
+        news_client._get_parser = MagicMock(return_value=mock_parser)
+        news_client._write = MagicMock(side_effect=OperationalError("", {}, None))
+
+        count, error = await news_client.fetch_headlines(SOURCE, "a", FEED_URL)
+
+        assert count == 0
+        assert isinstance(error, OperationalError)
+        assert session.exec(select(Articles)).all() == []
+        news_client.redis.set_feed_validators.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_validators_are_not_stored_when_the_parse_fails(
+        self, news_client, mock_parser
+    ):
+        headers = HTTPHeaders(
+            status_line="HTTP/1.1 200 OK",
+            headers={"content-type": "application/xml", **self.VALIDATORS},
+        )
+        news_client.http_client.request = AsyncMock(return_value=(headers, b"<rss"))
+        mock_parser.parse_content.side_effect = ValueError("truncated feed")
+        news_client._get_parser = MagicMock(return_value=mock_parser)
+
+        count, error = await news_client.fetch_headlines(SOURCE, "a", FEED_URL)
+
+        assert count == 0
+        assert isinstance(error, ValueError)
+        news_client.redis.set_feed_validators.assert_not_called()
+
+
+class TestFeedWorkers:
+    FEEDS = [(SOURCE, f"feed{i}", f"https://example.com/{i}.xml") for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_per_feed_errors_come_back_as_results(self, news_client):
+        errors = {"feed1": ValueError("bad feed"), "feed4": RSSFeedError("down")}
+
+        async def fetch_headlines(source_name, feed_name, url):
+            if feed_name in errors:
+                raise errors[feed_name]
+            return 1, None
+
+        news_client.fetch_headlines = fetch_headlines
+
+        results = await news_client.fetch_multiple_feeds(self.FEEDS)
+
+        assert results == [
+            (0, errors[name]) if name in errors else (1, None)
+            for _, name, _ in self.FEEDS
+        ]
+
+    @pytest.mark.asyncio
+    async def test_memory_error_aborts_the_batch(self, news_client):
+        await news_client.set_max_concurrency(2)
+        running = asyncio.Event()
+        cancelled = []
+
+        async def fetch_headlines(source_name, feed_name, url):
+            if feed_name == "feed0":
+                running.set()
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(feed_name)
+                    raise
+            await running.wait()
+            raise MemoryError()
+
+        news_client.fetch_headlines = fetch_headlines
+
+        with pytest.raises(MemoryError):
+            await news_client.fetch_multiple_feeds(self.FEEDS)
+
+        assert cancelled == ["feed0"]
+        assert news_client._active_feeds == 0
+
+    @pytest.mark.asyncio
+    async def test_lowering_concurrency_mid_batch_caps_active_feeds(self, news_client):
+        await news_client.set_max_concurrency(3)
+        started = asyncio.Event()
+        release = asyncio.Event()
+        lowered = False
+        active_after_lowering = []
+
+        async def fetch_headlines(source_name, feed_name, url):
+            if lowered:
+                active_after_lowering.append(news_client._active_feeds)
+            elif news_client._active_feeds == 3:
+                started.set()
+            await release.wait()
+            await asyncio.sleep(0.01)
+            return 1, None
+
+        news_client.fetch_headlines = fetch_headlines
+        batch = asyncio.create_task(news_client.fetch_multiple_feeds(self.FEEDS))
+
+        await started.wait()
+        await news_client.set_max_concurrency(1)
+        lowered = True
+        release.set()
+
+        assert await batch == [(1, None)] * 6
+        assert active_after_lowering == [1, 1, 1]
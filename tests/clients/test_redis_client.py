@@ -0,0 +1,31 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from src.clients.redis import RedisClient
+
+
+@pytest.fixture
+def failing_redis(monkeypatch):
+    """The shared RedisClient with a connection whose commands all fail"""
+    client = RedisClient()
+    connection = AsyncMock()
+    connection.get.side_effect = ConnectionError("redis down")
+    connection.set.side_effect = ConnectionError("redis down")
+    monkeypatch.setattr(client, "redis", connection)
+    monkeypatch.setattr(client, "_circuit_breaker", None)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_feed_validator_lookup_errors_are_swallowed(failing_redis):
+    """Test a Redis failure means no validators rather than a failed fetch"""
+    assert await failing_redis.get_feed_validators("https://example.com/feed") == {}
+
+
+@pytest.mark.asyncio
+async def test_feed_validator_update_errors_are_swallowed(failing_redis):
+    """Test a Redis failure while storing validators doesn't fail the fetch"""
+    await failing_redis.set_feed_validators(
+        "https://example.com/feed", {"etag": '"v1"'}
+    )
+    failing_redis.redis.set.assert_awaited_once()
@@ -12,11 +12,11 @@ from src.db.database import get_session
 from src.clients.redis import RedisClient
 from src.models.db_models import (
     Articles,
-    Categories,
+    Feeds,
     Sources,
     Users,
     FeedPreferences,
-    ArticleCategories,
+    ArticleFeeds,
 )
 from src.auth.security import get_password_hash, create_access_token
 
@@ -113,7 +113,8 @@ def mock_redis_client():
 def test_source(db_session):
     """Create a test news source"""
     source = Sources(
-        name="Test Source",
+        name="testsrc",
+        display_name="Test Source",
         feed_symbol="testsrc",
         base_url="https://test.com",
         fetch_interval=3600,
@@ -129,23 +130,24 @@ def test_source(db_session):
 
 
 @pytest.fixture
-def test_category(db_session, test_source):
-    """Create a test category"""
-    category = Categories(
-        name="Test Category",
+def test_feed(db_session, test_source):
+    """Create a test feed"""
+    feed = Feeds(
+        source_name=test_source.name,
+        name="test",
+        display_name="Test Feed",
         feed_url="https://test.com/feed.xml",
-        source_id=test_source.id,
         created_at=datetime.now(timezone.utc),
         updated_at=datetime.now(timezone.utc),
     )
-    db_session.add(category)
+    db_session.add(feed)
     db_session.commit()
-    db_session.refresh(category)
-    return category
+    db_session.refresh(feed)
+    return feed
 
 
 @pytest.fixture
-def test_articles(db_session, test_source, test_category):
+def test_articles(db_session, test_source, test_feed):
     """Create test articles"""
     articles = []
     for i in range(5):
@@ -156,20 +158,23 @@ def test_articles(db_session, test_source, test_category):
             title=f"Test Article {i}",
             pub_date=pub_date,
             pub_date_raw=pub_date_str,
-            content_hash=f"hash{i}",
-            source_id=test_source.id,
+            signature=f"hash{i}",
+            source_name=test_source.name,
             original_url=f"https://test.com/article-{i}",
             created_at=datetime.now(timezone.utc),
             updated_at=datetime.now(timezone.utc),
         )
 
-        # Add category association
         db_session.add(article)
         db_session.commit()
         db_session.refresh(article)
 
-        # Create category association
-        assoc = ArticleCategories(article_id=article.id, category_id=test_category.id)
+        # Link the article to its feed
+        assoc = ArticleFeeds(
+            article_id=article.id,
+            feed_source_name=test_feed.source_name,
+            feed_name=test_feed.name,
+        )
         db_session.add(assoc)
 
         articles.append(article)
@@ -179,11 +184,12 @@ def test_articles(db_session, test_source, test_category):
 
 
 @pytest.fixture
-def user_feed_preference(db_session, test_user, test_category):
+def user_feed_preference(db_session, test_user, test_feed):
     """Create a feed preference for the test user"""
     pref = FeedPreferences(
         user_id=test_user.id,
-        feed_id=test_category.id,
+        feed_source_name=test_feed.source_name,
+        feed_name=test_feed.name,
         is_active=True,
         created_at=datetime.now(timezone.utc),
         last_fetched=datetime.now(timezone.utc),
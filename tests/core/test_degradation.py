@@ -0,0 +1,96 @@
+import time
+
+import pytest
+
+from src.core.degradation import CircuitBreaker, CircuitState
+from src.core.exceptions import ServiceUnavailableError
+
+
+async def fail():
+    raise ValueError("boom")
+
+
+@pytest.mark.asyncio
+async def test_cache_is_lru_capped():
+    """Test that the fallback cache evicts least recently used keys"""
+    breaker = CircuitBreaker("test", cache_maxsize=2)
+
+    async def value(v):
+        return v
+
+    for key in ("a", "b", "c"):
+        await breaker.execute(value, key, cache_key=key)
+
+    assert list(breaker.cache) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_is_not_served():
+    """Test that stale cached results aren't used as a fallback"""
+    breaker = CircuitBreaker("test", failure_threshold=1, cache_ttl=60)
+
+    async def ok():
+        return "fresh"
+
+    await breaker.execute(ok, cache_key="key")
+    assert await breaker.execute(fail, cache_key="key") == "fresh"
+    assert breaker.state == CircuitState.OPEN
+
+    value, _ = breaker.cache["key"]
+    breaker.cache["key"] = (value, 0)
+
+    with pytest.raises(ServiceUnavailableError):
+        await breaker.execute(fail, cache_key="key")
+    assert "key" not in breaker.cache
+
+
+@pytest.mark.asyncio
+async def test_positional_args_reach_the_function():
+    """Test that positional args aren't swallowed by cache_key"""
+    breaker = CircuitBreaker("test")
+
+    async def double(value):
+        return value * 2
+
+    assert await breaker.execute(double, 21) == 42
+    assert not breaker.cache
+
+
+@pytest.mark.asyncio
+async def test_open_timeout_ignores_wall_clock_jumps(monkeypatch):
+    """Test that a backwards wall clock jump doesn't keep the circuit open"""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=10)
+
+    with pytest.raises(ValueError):
+        await breaker.execute(fail)
+    assert breaker.state == CircuitState.OPEN
+
+    # wall clock jumps back an hour, monotonic time moves past the timeout
+    real_monotonic = time.monotonic()
+    monkeypatch.setattr(time, "time", lambda: breaker.last_failure_time - 3600)
+    monkeypatch.setattr(time, "monotonic", lambda: real_monotonic + 11)
+
+    async def ok():
+        return "ok"
+
+    assert await breaker.execute(ok) == "ok"
+    assert breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_open_window_is_jittered_and_backs_off():
+    """Test that open windows fall in [timeout / 2, timeout] and double per probe"""
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=100)
+
+    with pytest.raises(ValueError):
+        await breaker.execute(fail)
+    assert breaker.state == CircuitState.OPEN
+    assert 50 <= breaker.open_window <= 100
+
+    # let the probe through, it fails and the timeout doubles
+    breaker._last_failure_monotonic -= breaker.open_window
+    with pytest.raises(ValueError):
+        await breaker.execute(fail)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.current_timeout == 200
+    assert 100 <= breaker.open_window <= 200
@@ -5,7 +5,7 @@ import tempfile
 import os
 from unittest.mock import patch, MagicMock
 
-from src.core.logging import CustomFormatter, setup_logging
+from src.core.logging import CustomFormatter, LogContext, LogThrottle, setup_logging
 
 DEBUG_LEVEL = logging.DEBUG
 INFO_LEVEL = logging.INFO
@@ -150,3 +150,38 @@ class TestSetupLogging:
         finally:
             if os.path.exists(temp_log_file):
                 os.unlink(temp_log_file)
+
+
+class TestLogContext:
+    def test_disabled_level_skips_logging(self):
+        log = LogContext("test_log_context")
+        log.logger.setLevel(INFO_LEVEL)
+
+        with (
+            patch("src.core.logging.get_correlation_context") as mock_context,
+            patch.object(log.logger, "log") as mock_log,
+        ):
+            assert not log.is_enabled_for(DEBUG_LEVEL)
+            log.debug("Debug message", extra={"key": "value"})
+            mock_context.assert_not_called()
+            mock_log.assert_not_called()
+
+            mock_context.return_value = {}
+            log.info("Info message")
+            mock_log.assert_called_once()
+
+
+class TestLogThrottle:
+    def test_repeats_within_interval_are_suppressed(self):
+        throttle = LogThrottle(interval=60.0)
+
+        with patch("src.core.logging.time.monotonic", return_value=100.0):
+            assert throttle.allow("redis:ConnectionError") == 0
+            assert throttle.allow("redis:ConnectionError") is None
+            assert throttle.allow("redis:ConnectionError") is None
+            # other keys have their own window
+            assert throttle.allow("db:OperationalError") == 0
+
+        with patch("src.core.logging.time.monotonic", return_value=160.0):
+            assert throttle.allow("redis:ConnectionError") == 2
+            assert throttle.allow("redis:ConnectionError") is None
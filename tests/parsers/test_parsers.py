@@ -149,6 +149,79 @@ class TestXMLParser:
         assert len(articles) == 1
         assert articles[0].title == "Valid Article"
 
+    @pytest.mark.asyncio
+    async def test_parses_bytes_in_declared_encoding(self):
+        parser = XMLFeedParser("test")
+        xml = """<?xml version="1.0" encoding="ISO-8859-1"?>
+        <rss><channel><item>
+            <title>K\u00f8benhavn</title>
+            <pubDate>Wed, 01 Mar 2023 12:00:00 GMT</pubDate>
+            <link>https://example.com/article1</link>
+        </item></channel></rss>
+        """.encode("iso-8859-1")
+        articles = await parser.parse_content(xml)
+        assert len(articles) == 1
+        assert articles[0].title == "K\u00f8benhavn"
+
+    @pytest.mark.asyncio
+    async def test_bytes_with_wrong_encoding_are_parsed_leniently(self):
+        parser = XMLFeedParser("test")
+        xml = b"""<rss><channel><item>
+            <title>Bad \xff byte</title>
+            <pubDate>Wed, 01 Mar 2023 12:00:00 GMT</pubDate>
+            <link>https://example.com/article1</link>
+        </item></channel></rss>
+        """
+        articles = await parser.parse_content(xml)
+        assert len(articles) == 1
+        assert articles[0].title == "Bad \ufffd byte"
+
+    @pytest.mark.asyncio
+    async def test_items_spanning_feed_chunks_are_parsed(self):
+        parser = XMLFeedParser("test")
+        items = "".join(
+            f"""<item>
+                <title>Article {i}</title>
+                <pubDate>Wed, 01 Mar 2023 12:00:00 GMT</pubDate>
+                <link>https://example.com/article{i}</link>
+                <description>{"x" * 1000}</description>
+            </item>"""
+            for i in range(200)
+        )
+        xml = f"<rss><channel>{items}</channel></rss>".encode()
+        articles = await parser.parse_content(xml)
+        assert len(articles) == 200
+        assert articles[-1].title == "Article 199"
+        assert articles[0].description == "x" * 1000
+
+    @pytest.mark.asyncio
+    async def test_namespaced_fields_are_found(self):
+        parser = XMLFeedParser("test")
+        xml = b"""<rss xmlns:dc="http://purl.org/dc/elements/1.1/"
+            xmlns:content="http://purl.org/rss/1.0/modules/content/">
+            <channel><item>
+                <title>Namespaced</title>
+                <dc:date>2023-03-01T12:00:00Z</dc:date>
+                <dc:creator>Jane Roe</dc:creator>
+                <content:encoded>Full body</content:encoded>
+            </item></channel>
+        </rss>"""
+        articles = await parser.parse_content(xml)
+        assert len(articles) == 1
+        assert articles[0].pub_date_raw == "2023-03-01T12:00:00Z"
+        assert articles[0].author_name == "Jane Roe"
+        assert articles[0].description == "Full body"
+
+    def test_unparseable_dates_are_not_cached(self):
+        parser = XMLFeedParser("test")
+        rfc_date = "Wed, 01 Mar 2023 12:00:00 GMT"
+        assert parser._parse_date(rfc_date) == parser._parse_date(rfc_date)
+
+        first = parser._parse_date("not a date")
+        second = parser._parse_date("not a date")
+        assert first.tzinfo is not None
+        assert second >= first
+
 
 class TestJSONParser:
     async def test_parse_content_returns_articles_list(self, mock_json_response):
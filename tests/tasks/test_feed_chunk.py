@@ -77,6 +77,7 @@ class TestFetchFeedChunk:
         mock_asyncio.new_event_loop.return_value.run_until_complete.side_effect = [
             [(3, 1), (2, 0)],  # Result from fetch_multiple_feeds
             None,  # Result from redis_client.close()
+            None,  # Result from http_client.close()
         ]
 
         result = fetch_feed_chunk(feeds_chunk)
@@ -113,6 +114,7 @@ class TestFetchFeedChunk:
         mock_asyncio.new_event_loop.return_value.run_until_complete.side_effect = [
             error_result,  # Result from fetch_multiple_feeds
             None,  # Result from redis_client.close()
+            None,  # Result from http_client.close()
         ]
 
         # Set a constant time to avoid StopIteration
@@ -174,6 +176,7 @@ class TestFetchFeedChunk:
         mock_asyncio.new_event_loop.return_value.run_until_complete.side_effect = [
             [],  # Empty result from fetch_multiple_feeds
             None,  # Result from redis_client.close()
+            None,  # Result from http_client.close()
         ]
 
         # Set a constant time to avoid StopIteration
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from src.utils.batching import KeyBatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_batch():
+    """Test that lookups within the window are resolved by a single call"""
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(keys)
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    batcher = KeyBatcher(batch_fn, default="none")
+
+    first, second = await asyncio.gather(
+        batcher.load({"a", "b"}), batcher.load({"b", "c", "missing"})
+    )
+
+    assert calls == [{"a", "b", "c", "missing"}]
+    assert first == {"a": "A", "b": "B"}
+    assert second == {"b": "B", "c": "C", "missing": "none"}
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reach_every_caller():
+    """Test that a failed batch raises for all callers in it"""
+
+    async def batch_fn(keys):
+        raise ConnectionError("down")
+
+    batcher = KeyBatcher(batch_fn)
+
+    results = await asyncio.gather(
+        batcher.load({"a"}), batcher.load({"b"}), return_exceptions=True
+    )
+
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert await batcher.load(set()) == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_leaves_shared_keys_to_others():
+    """Test that cancelling one caller doesn't cancel keys another awaits"""
+    release = asyncio.Event()
+
+    async def batch_fn(keys):
+        await release.wait()
+        return {key: key.upper() for key in keys}
+
+    batcher = KeyBatcher(batch_fn)
+
+    cancelled = asyncio.create_task(batcher.load({"a"}))
+    other = asyncio.create_task(batcher.load({"a", "b"}))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    assert await other == {"a": "A", "b": "B"}
+    assert cancelled.cancelled()
@@ -0,0 +1,24 @@
+from src.utils.latency import LatencyWindow
+
+
+def test_percentile_uses_nearest_rank():
+    """Test that the percentile is picked from the recorded samples"""
+    window = LatencyWindow()
+    assert window.percentile(0.95) is None
+
+    for ms in range(1, 101):
+        window.add(ms / 1000)
+
+    assert len(window) == 100
+    assert window.percentile(0.95) == 0.095
+    assert window.percentile(0.5) == 0.05
+
+
+def test_window_only_keeps_recent_samples():
+    """Test that old samples fall out so the estimate follows drift"""
+    window = LatencyWindow(size=4)
+    for seconds in (10.0, 10.0, 1.0, 1.0, 1.0, 1.0):
+        window.add(seconds)
+
+    assert len(window) == 4
+    assert window.percentile(0.95) == 1.0
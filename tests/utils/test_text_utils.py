@@ -0,0 +1,27 @@
+from src.utils.text_utils import (
+    calculate_title_similarity,
+    matcher_similarity,
+    title_matcher,
+)
+
+
+def test_matcher_similarity_matches_pairwise_score():
+    """Test that a reused matcher scores every title like the pairwise function"""
+    existing = "Markets rally as inflation cools"
+    matcher = title_matcher(existing)
+
+    for title in (
+        "Markets rally as inflation cools!",
+        "Inflation cools, markets rally",
+        "Something else entirely",
+    ):
+        assert matcher_similarity(matcher, title) == calculate_title_similarity(
+            title, existing
+        )
+
+
+def test_empty_titles_score_zero():
+    """Test that empty titles never count as similar"""
+    assert title_matcher("") is None
+    assert matcher_similarity(None, "Title") == 0.0
+    assert matcher_similarity(title_matcher("Title"), "") == 0.0